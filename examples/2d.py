@@ -6,7 +6,7 @@ Example: 2D Static Orbit Visualization
 import sys
 import os
 from PyQt5.QtWidgets import QApplication, QMainWindow, QVBoxLayout, QWidget
-from islam_reda_orbit import OrbitPlot
+from orbit_pyqtgraph import OrbitPlot
 
 class Example2DStatic(QMainWindow):
     def __init__(self):
@@ -26,7 +26,7 @@ class Example2DStatic(QMainWindow):
         ]
         
         # Get earth texture path
-        earth_texture = os.path.join(os.path.dirname(__file__), '..', 'islam_reda_orbit', 'assets', 'earth.jpg')
+        earth_texture = os.path.join(os.path.dirname(__file__), '..', 'orbit_pyqtgraph', 'assets', 'earth.jpg')
         
         # Create orbit plot widget
         self.orbit_plot = OrbitPlot(kepler_elems, earth_texture=earth_texture)
@@ -5,8 +5,9 @@ Example: 2D Animated Orbit Visualization
 
 import sys
 import os
+import numpy as np
 from PyQt5.QtWidgets import QApplication, QMainWindow, QVBoxLayout, QWidget
-from islam_reda_orbit import OrbitPlot, tle_to_kepler6
+from orbit_pyqtgraph import OrbitPlot, tle_to_kepler6_batch
 
 class Example2DAnimated(QMainWindow):
     def __init__(self):
@@ -14,16 +15,15 @@ class Example2DAnimated(QMainWindow):
         self.setWindowTitle("2D Animated Orbit - Islam Reda Orbit Library")
         self.setGeometry(100, 100, 1000, 800)
         
-        # TLE for ISS
-        L1 = "1 25544U 98067A   25229.18034946  .00009619  00000-0  17645-3 0  9996"
-        L2 = "2 25544  51.6356   4.7550 0003499 229.5075 130.5609 15.49975761524621"
+        # TLEs for ISS; add more pairs to convert a whole batch at once
+        L1_list = ["1 25544U 98067A   25229.18034946  .00009619  00000-0  17645-3 0  9996"]
+        L2_list = ["2 25544  51.6356   4.7550 0003499 229.5075 130.5609 15.49975761524621"]
         
-        # Convert TLE to Keplerian elements
-        a_km, e, i_deg, raan_deg, argp_deg, M0_deg, epoch_time_s = tle_to_kepler6(L1, L2)
-        kepler_elems = [a_km, e, i_deg, raan_deg, argp_deg, M0_deg, epoch_time_s]
+        # Convert TLEs to an (N, 7) table of Keplerian elements
+        kepler_elems = np.column_stack(tle_to_kepler6_batch(L1_list, L2_list))
         
         # Get earth texture path
-        earth_texture = os.path.join(os.path.dirname(__file__), '..', 'islam_reda_orbit', 'assets', 'earth.jpg')
+        earth_texture = os.path.join(os.path.dirname(__file__), '..', 'orbit_pyqtgraph', 'assets', 'earth.jpg')
         
         # Create orbit plot widget
         self.orbit_plot = OrbitPlot(kepler_elems, earth_texture=earth_texture)
@@ -14,9 +14,13 @@ __all__ = [
     "OrbitPlot",
     "EarthGLWidget",
     "tle_to_kepler6",
+    "tle_to_kepler6_batch",
     "propagate_orbit",
+    "propagate_orbit_lut",
     "kepler_E",
     "oe_to_rv",
+    "gmst_rad",
     "eci_to_ecef",
-    "ecef_to_latlon"
+    "ecef_to_latlon",
+    "propagate_latlon"
 ]
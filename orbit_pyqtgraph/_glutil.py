@@ -0,0 +1,145 @@
+"""
+OpenGL helpers shared by EarthGLWidget (orbit.py) and the standalone viewers in assets/:
+shader program building, the GLSL 3.30 Earth/flat shaders and sphere tessellation.
+Only Qt and NumPy are imported here, so the viewers can still set OpenGL.ERROR_CHECKING
+before they import OpenGL.GL.
+"""
+import numpy as np
+from PyQt5 import QtGui
+
+
+# ---------------------------
+# Shaders (GLSL 3.30 core), used by assets/arch1.py and assets/arch2.py
+# ---------------------------
+# Earth: per-fragment point light in eye space, same ambient/diffuse terms the old
+# fixed-function path produced with the default material, modulated by the texture.
+EARTH_VERT_330 = """
+#version 330 core
+layout(location = 0) in vec3 aPos;
+layout(location = 1) in vec3 aNormal;
+layout(location = 2) in vec2 aUV;
+uniform mat4 uMVP;
+uniform mat4 uModelView;
+uniform mat3 uNormalMatrix;
+out vec3 vEyePos;
+out vec3 vNormal;
+out vec2 vUV;
+void main() {
+    vEyePos = (uModelView * vec4(aPos, 1.0)).xyz;
+    vNormal = uNormalMatrix * aNormal;
+    vUV = aUV;
+    gl_Position = uMVP * vec4(aPos, 1.0);
+}
+"""
+
+EARTH_FRAG_330 = """
+#version 330 core
+in vec3 vEyePos;
+in vec3 vNormal;
+in vec2 vUV;
+uniform sampler2D uEarthTex;
+uniform bool uUseTexture;
+uniform vec3 uLightPos;      // eye space
+uniform vec3 uLightAmbient;
+uniform vec3 uLightDiffuse;
+out vec4 fragColor;
+void main() {
+    vec3 n = normalize(vNormal);
+    vec3 l = normalize(uLightPos - vEyePos);
+    vec3 lit = 0.2 * (uLightAmbient + vec3(0.2)) + 0.8 * uLightDiffuse * max(dot(n, l), 0.0);
+    vec4 base = uUseTexture ? texture(uEarthTex, vUV) : vec4(1.0);
+    fragColor = vec4(base.rgb * lit, base.a);
+}
+"""
+
+# Flat: unlit per-vertex color, used for the orbit line and the satellite mesh.
+FLAT_VERT_330 = """
+#version 330 core
+layout(location = 0) in vec3 aPos;
+layout(location = 1) in vec3 aColor;
+uniform mat4 uMVP;
+out vec3 vColor;
+void main() {
+    vColor = aColor;
+    gl_Position = uMVP * vec4(aPos, 1.0);
+}
+"""
+
+FLAT_FRAG_330 = """
+#version 330 core
+in vec3 vColor;
+out vec4 fragColor;
+void main() {
+    fragColor = vec4(vColor, 1.0);
+}
+"""
+
+
+def build_program(vertex_src, fragment_src, attributes=(), parent=None):
+    """
+    Compile and link a QOpenGLShaderProgram; raises RuntimeError with the GL log on failure.
+    attributes: names bound to locations 0, 1, 2, ... (for GLSL without layout qualifiers),
+    so draw code can use glVertexAttribPointer(0/1/2, ...) directly.
+    """
+    program = QtGui.QOpenGLShaderProgram(parent)
+    if not program.addShaderFromSourceCode(QtGui.QOpenGLShader.Vertex, vertex_src):
+        raise RuntimeError(program.log())
+    if not program.addShaderFromSourceCode(QtGui.QOpenGLShader.Fragment, fragment_src):
+        raise RuntimeError(program.log())
+    for location, name in enumerate(attributes):
+        program.bindAttributeLocation(name, location)
+    if not program.link():
+        raise RuntimeError(program.log())
+    return program
+
+
+def sphere_strip_indices(stacks, slices):
+    """
+    uint32 indices over a (stacks + 1) x (slices + 1) vertex grid that draw every band
+    (rows i, i+1) as a GL_TRIANGLE_STRIP, joined by degenerate triangles so the whole
+    sphere is one glDrawElements call.
+    """
+    grid = np.arange((stacks + 1) * (slices + 1), dtype=np.uint32).reshape(stacks + 1, slices + 1)
+    # band i runs (row_i, row_i+1) pairs, like a GL_QUAD_STRIP
+    bands = np.stack([grid[:-1], grid[1:]], axis=-1).reshape(stacks, -1)
+    # repeat the last index of each band and the first of the next -> degenerate joins
+    joined = np.concatenate([bands[:, :1], bands, bands[:, -1:]], axis=1).ravel()[1:-1]
+    return np.ascontiguousarray(joined, dtype=np.uint32)
+
+
+def build_earth_mesh(radius, stacks, slices):
+    """
+    Latitude/longitude sphere (z up) with an equirectangular texture mapping, as
+    EarthGLWidget draws the Earth and the satellite body.
+    Returns an interleaved float32 (V, 8) array of (x, y, z, nx, ny, nz, u, v) and the
+    sphere_strip_indices for it.
+    """
+    lat = np.pi * (-0.5 + np.arange(stacks + 1) / stacks)
+    lon = 2 * np.pi * (np.arange(slices + 1) / slices)
+    lat, lon = np.meshgrid(lat, lon, indexing="ij")
+    r = np.cos(lat)
+    normals = np.stack([r*np.cos(lon), r*np.sin(lon), np.sin(lat)], axis=-1).reshape(-1, 3)
+    uvs = np.stack([lon / (2*np.pi), 0.5 + lat / np.pi], axis=-1).reshape(-1, 2)
+    verts = np.column_stack([radius*normals, normals, uvs]).astype(np.float32)
+    return verts, sphere_strip_indices(stacks, slices)
+
+
+def build_sphere(radius, slices, stacks):
+    """
+    Sphere with the same vertex layout and texture mapping as gluSphere, as the assets/
+    viewers draw it.
+    Returns float32 positions (V, 3), normals (V, 3), uvs (V, 2) and the
+    sphere_strip_indices for it.
+    """
+    rho = np.linspace(0.0, np.pi, stacks + 1)
+    theta = np.linspace(0.0, 2.0 * np.pi, slices + 1)
+    theta[-1] = 0.0  # close the seam on exactly the same vertex position
+    rho, theta = np.meshgrid(rho, theta, indexing="ij")
+    normals = np.stack([-np.sin(theta) * np.sin(rho),
+                        np.cos(theta) * np.sin(rho),
+                        np.cos(rho)], axis=-1).reshape(-1, 3)
+    positions = normals * radius
+    s, t = np.meshgrid(np.arange(slices + 1) / slices, 1.0 - np.arange(stacks + 1) / stacks)
+    uvs = np.column_stack([s.ravel(), t.ravel()])
+    return (positions.astype(np.float32), normals.astype(np.float32),
+            uvs.astype(np.float32), sphere_strip_indices(stacks, slices))
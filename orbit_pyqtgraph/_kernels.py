@@ -0,0 +1,164 @@
+"""
+Optional compiled kernels for the orbital math hot paths.
+Numba is not a hard dependency: when it is missing HAVE_NUMBA is False and
+orb_math falls back to its pure NumPy code. Install with
+    pip install orbit_pyqtgraph[fast]
+The kernels use error_model="numpy" so divisions carry no Python ZeroDivision
+check; together with fastmath this lets LLVM vectorize the per-sample loops
+(using SVML sin/cos when Intel's icc_rt is installed).
+"""
+import math
+import os
+
+import numpy as np
+
+# The prange loops share the machine with Qt's UI/render threads; at a few thousand
+# samples per frame more than 4 workers buys nothing, so cap the pool unless the user
+# already chose a size (only effective if numba is not imported yet)
+os.environ.setdefault("NUMBA_NUM_THREADS", str(min(4, os.cpu_count() or 1)))
+
+try:
+    import numba
+    HAVE_NUMBA = True
+except ImportError:  # pragma: no cover - depends on the environment
+    numba = None
+    HAVE_NUMBA = False
+
+# globals are frozen into the jitted code as compile-time constants
+_PI = math.pi
+_TWO_PI = 2.0 * math.pi
+_RAD2DEG = 180.0 / math.pi
+
+
+if HAVE_NUMBA:
+
+    @numba.njit(parallel=True, fastmath=True, error_model="numpy", cache=True)
+    def propagate_kernel(a, e, n, M0, t0, q00, q01, q10, q11, q20, q21, times, out):
+        """
+        Fused Kepler solve + perifocal position + rotation to ECI for every time sample.
+        q.. are the first two columns of the perifocal->ECI matrix (rz_pf is always 0).
+        Writes positions (km) into out (N x 3).
+        """
+        sq = math.sqrt(1.0 - e*e)
+        for k in numba.prange(times.shape[0]):
+            M = M0 + n * (times[k] - t0)
+            M -= _TWO_PI * math.floor((M + _PI) / _TWO_PI)  # wrap to [-pi, pi)
+            # Danby seed + 4 quartic iterations (converged for e < 0.99)
+            E = M + 0.85*e*math.copysign(1.0, math.sin(M))
+            for _ in range(4):
+                esE = e*math.sin(E); ecE = e*math.cos(E)
+                f = E - esE - M
+                fp = 1.0 - ecE
+                d1 = -f / fp
+                d2 = -f / (fp + 0.5*d1*esE)
+                E += -f / (fp + 0.5*d2*esE + d2*d2*ecE/6.0)
+            sE = math.sin(E); cE = math.cos(E)
+            # r cos f = a (cos E - e), r sin f = a sqrt(1-e^2) sin E
+            rx = a * (cE - e)
+            ry = a * sq * sE
+            out[k, 0] = q00*rx + q01*ry
+            out[k, 1] = q10*rx + q11*ry
+            out[k, 2] = q20*rx + q21*ry
+        return out
+
+    @numba.njit(parallel=True, fastmath=True, error_model="numpy", cache=True)
+    def kepler_kernel(M, e, tol, maxiter, out, cos_out, sin_out):
+        """
+        Danby solve of M = E - e sin E for a flat array of (already reduced) M.
+        sin/cos of E are taken together each step, which LLVM turns into one sincos.
+        Each element stops as soon as its own correction drops below tol.
+        If cos_out/sin_out are non-empty they receive cos/sin of the final E, updated
+        to first order from the last step's sincos.
+        """
+        want_trig = cos_out.shape[0] > 0
+        for k in numba.prange(M.shape[0]):
+            Mk = M[k]
+            E = Mk + 0.85*e*math.copysign(1.0, math.sin(Mk))
+            # sE/cE are always the trig of E - dE, also when the loop never runs (maxiter=0)
+            sE = math.sin(E); cE = math.cos(E); dE = 0.0
+            for _ in range(maxiter):
+                esE = e*sE; ecE = e*cE
+                f = E - esE - Mk
+                fp = 1.0 - ecE
+                d1 = -f / fp
+                d2 = -f / (fp + 0.5*d1*esE)
+                dE = -f / (fp + 0.5*d2*esE + d2*d2*ecE/6.0)
+                E += dE
+                if abs(dE) < tol:
+                    break
+                sE = math.sin(E); cE = math.cos(E); dE = 0.0
+            out[k] = E
+            if want_trig:
+                cos_out[k] = cE - sE*dE
+                sin_out[k] = sE + cE*dE
+        return out
+
+    @numba.njit(parallel=True, fastmath=True, error_model="numpy", cache=True)
+    def eci_to_ecef_kernel(r, theta, out):
+        """
+        Rotate ECI positions (N x 3) about z by theta (N,) into out, in one streaming pass:
+        one sincos and four multiply-adds per sample, all in registers.
+        """
+        for k in numba.prange(r.shape[0]):
+            ct = math.cos(theta[k]); st = math.sin(theta[k])
+            x = r[k, 0]; y = r[k, 1]
+            out[k, 0] = ct*x + st*y
+            out[k, 1] = -st*x + ct*y
+            out[k, 2] = r[k, 2]
+        return out
+
+    @numba.njit(parallel=True, fastmath=True, error_model="numpy", cache=True)
+    def propagate_latlon_kernel(a, e, n, M0, t0, q00, q01, q10, q11, q20, q21, times,
+                                gst0, omega, wgs_a, wgs_b, wgs_e2, wgs_ep2, lat_out, lon_out):
+        """
+        propagate_kernel, the z rotation by gst0 + omega*t and Bowring's geodetic latitude
+        fused into one pass: each sample goes from t to (lat, lon) in degrees without
+        writing any (N x 3) intermediate. lon is in [-180, 180].
+        """
+        sq = math.sqrt(1.0 - e*e)
+        for k in numba.prange(times.shape[0]):
+            M = M0 + n * (times[k] - t0)
+            M -= _TWO_PI * math.floor((M + _PI) / _TWO_PI)
+            E = M + 0.85*e*math.copysign(1.0, math.sin(M))
+            for _ in range(4):
+                esE = e*math.sin(E); ecE = e*math.cos(E)
+                f = E - esE - M
+                fp = 1.0 - ecE
+                d1 = -f / fp
+                d2 = -f / (fp + 0.5*d1*esE)
+                E += -f / (fp + 0.5*d2*esE + d2*d2*ecE/6.0)
+            rx = a * (math.cos(E) - e)
+            ry = a * sq * math.sin(E)
+            xi = q00*rx + q01*ry
+            yi = q10*rx + q11*ry
+            z = q20*rx + q21*ry
+            # ECI -> ECEF
+            th = gst0 + omega * times[k]
+            ct = math.cos(th); st = math.sin(th)
+            x = ct*xi + st*yi
+            y = -st*xi + ct*yi
+            # ECEF -> geodetic (Bowring)
+            p = math.sqrt(x*x + y*y)
+            u = math.atan2(wgs_a*z, wgs_b*p)
+            su = math.sin(u); cu = math.cos(u)
+            lat_out[k] = _RAD2DEG * math.atan2(z + wgs_ep2*wgs_b*su*su*su, p - wgs_e2*wgs_a*cu*cu*cu)
+            lon_out[k] = _RAD2DEG * math.atan2(y, x)
+        return lat_out, lon_out
+
+
+def warmup():
+    """
+    Compile (or load from the on-disk cache) the kernel specializations OrbitPlot uses,
+    on tiny inputs, so the JIT cost is paid up front and not on the first animation frame.
+    No-op without Numba.
+    """
+    if not HAVE_NUMBA:
+        return
+    t = np.zeros(2)
+    pos = np.empty((2, 3), order='F')  # OrbitPlot keeps its position buffers column-major
+    propagate_kernel(7000.0, 0.0, 1e-3, 0.0, 0.0, 1.0, 0.0, 0.0, 1.0, 0.0, 0.0, t, pos)
+    kepler_kernel(t, 0.1, 1e-10, 100, np.empty(2), np.empty(2), np.empty(2))
+    eci_to_ecef_kernel(pos, t, np.empty((2, 3), order='F'))
+    lat, lon = np.empty(2, np.float32), np.empty(2, np.float32)  # liveorbit draws float32
+    propagate_latlon_kernel(7000.0, 0.0, 1e-3, 0.0, 0.0, 1.0, 0.0, 0.0, 1.0, 0.0, 0.0, t,
+                            0.0, 7.2921150e-5, 6378.137, 6356.752, 6.69e-3, 6.74e-3, lat, lon)
@@ -1,13 +1,81 @@
 # earth_orbit_viewer.py
 import sys
+import ctypes
+from functools import lru_cache
 import numpy as np
-from PyQt5 import QtWidgets, QtOpenGL, QtCore
+from PyQt5 import QtWidgets, QtCore, QtGui
+import OpenGL
+# Drawing already goes through a handful of VAO calls per frame; skip PyOpenGL's
+# glGetError round-trip after each one (must be set before OpenGL.GL is imported).
+OpenGL.ERROR_CHECKING = False
 from OpenGL.GL import *
-from OpenGL.GLU import *
 from PIL import Image
-
-
-class EarthOrbitViewer(QtOpenGL.QGLWidget):
+from orbit_pyqtgraph._glutil import (EARTH_VERT_330, EARTH_FRAG_330, FLAT_VERT_330, FLAT_FRAG_330,
+                                     build_program, build_sphere)
+
+_DEG2RAD = np.pi / 180.0
+
+# Light parameters (eye space); uploaded to the Earth program once in initializeGL
+_LIGHT_POS = (5.0, 5.0, 10.0)
+_LIGHT_AMB = (0.25, 0.25, 0.25)
+_LIGHT_DIF = (1.0, 1.0, 1.0)
+
+
+# Satellites: the unit marker mesh drawn once per instance, offset by a per-instance
+# position (attribute divisor 1) so N satellites cost a single draw call.
+_SAT_VERT = """
+#version 330 core
+layout(location = 0) in vec3 aPos;
+layout(location = 1) in vec3 aColor;
+layout(location = 2) in vec3 aInstancePos;
+uniform mat4 uMVP;
+uniform float uSize;
+out vec3 vColor;
+void main() {
+    vColor = aColor;
+    gl_Position = uMVP * vec4(aPos * uSize + aInstancePos, 1.0);
+}
+"""
+
+
+@lru_cache(maxsize=None)
+def _unit_satellite_mesh():
+    """Indexed unit-size satellite: a cube body plus two thin solar panels.
+
+    Returns float32 positions (N, 3), float32 colors (N, 3) and uint32 triangle
+    indices (M,) with 8 unique corners per box. Two extra vertices at the end of the
+    arrays form the antenna line. The marker is scaled by its size at draw time;
+    the panel thickness matches the previous 0.002 * earth_radius for a 0.03 *
+    earth_radius body.
+    """
+    boxes = [
+        # (center, half extents, color)
+        ((0.0, 0.0, 0.0), (0.5, 0.5, 0.5), (0.85, 0.85, 0.85)),
+        ((-2.3, 0.0, 0.0), (1.3, 0.225, 1.0 / 30.0), (0.12, 0.18, 0.55)),
+        ((2.3, 0.0, 0.0), (1.3, 0.225, 1.0 / 30.0), (0.12, 0.18, 0.55)),
+    ]
+    corners = np.array([[x, y, z] for x in (-1, 1) for y in (-1, 1) for z in (-1, 1)], dtype=np.float32)
+    # two triangles per face, corner ids follow the (x, y, z) bit order above
+    faces = np.array([[1, 5, 7], [1, 7, 3],   # +Z
+                      [0, 2, 6], [0, 6, 4],   # -Z
+                      [2, 3, 7], [2, 7, 6],   # +Y
+                      [0, 4, 5], [0, 5, 1],   # -Y
+                      [4, 6, 7], [4, 7, 5],   # +X
+                      [0, 1, 3], [0, 3, 2]],  # -X
+                     dtype=np.uint32)
+    positions, colors, indices = [], [], []
+    for k, (center, half, color) in enumerate(boxes):
+        positions.append(corners * np.asarray(half, dtype=np.float32) + np.asarray(center, dtype=np.float32))
+        colors.append(np.tile(np.asarray(color, dtype=np.float32), (8, 1)))
+        indices.append(faces.ravel() + 8 * k)
+    # antenna (drawn as GL_LINES from the last two vertices)
+    positions.append(np.array([[0.0, 1.0, 0.0], [0.0, 1.6, 0.0]], dtype=np.float32))
+    colors.append(np.full((2, 3), 0.2, dtype=np.float32))
+    return (np.concatenate(positions), np.concatenate(colors),
+            np.concatenate(indices).astype(np.uint32))
+
+
+class EarthOrbitViewer(QtWidgets.QOpenGLWidget):
     def __init__(self,
                  orbit_true_anomaly=None,
                  orbit_radius=None,
@@ -16,8 +84,14 @@ class EarthOrbitViewer(QtOpenGL.QGLWidget):
                  texture_path="earth.jpg",
                  orbit_color=(1.0, 1.0, 0.0),
                  satellite_period=90.0,   # seconds
+                 satellite_phases=None,   # orbit phase offsets in [0, 1), one per satellite
                  parent=None):
         super(EarthOrbitViewer, self).__init__(parent)
+        fmt = QtGui.QSurfaceFormat()
+        fmt.setVersion(3, 3)
+        fmt.setProfile(QtGui.QSurfaceFormat.CoreProfile)
+        fmt.setDepthBufferSize(24)
+        self.setFormat(fmt)
 
         # Parameters (public)
         self.earth_radius = float(earth_diameter) / 2.0
@@ -25,272 +99,426 @@ class EarthOrbitViewer(QtOpenGL.QGLWidget):
         self.texture_path = texture_path
         self.orbit_color = tuple(orbit_color)
         self.satellite_period = float(satellite_period)
-
-        # Orbit arrays (must be same length)
-        if orbit_true_anomaly is not None:
-            self.orbit_true_anomaly = np.asarray(orbit_true_anomaly, dtype=float)
-        else:
-            self.orbit_true_anomaly = None
-
-        if orbit_radius is not None:
-            self.orbit_radius = np.asarray(orbit_radius, dtype=float)
-        else:
-            self.orbit_radius = None
-
-        # GL resources
+        if satellite_phases is None:
+            satellite_phases = (0.0,)
+        self.satellite_phases = np.asarray(satellite_phases, dtype=np.float64).ravel()
+
+        # Orbit arrays (must be same length), trig tables and (N, 3) float32 vertices
+        # derived from them; _has_orbit is only recomputed when the arrays change
+        self.orbit_true_anomaly = None
+        self.orbit_radius = None
+        self._cos_ta = None
+        self._sin_ta = None
+        self._ta_unwrapped = None
+        self._orbit_xyz = None
+        self._orbit_dirty = False
+        self._has_orbit = False
+        self._set_orbit(orbit_true_anomaly, orbit_radius)
+
+        # GL resources (one VAO per object)
         self.earthTexture = None
+        self.earthProgram = None
+        self.flatProgram = None
+        self.satProgram = None
+        self.orbitVao = None
+        self.orbitVbo = None
+        self.orbitIbo = None
+        self.orbitIndexCount = 0
+        self.orbit_tolerance_px = 1.0  # drawn orbit vertices are kept about this far apart on screen
+        self._orbit_lod_dirty = True
+        self.sphereVao = None
+        self.sphereVbo = None
+        self.sphereIbo = None
+        self.sphereIndexCount = 0
+        self.satVao = None
+        self.satVbo = None
+        self.satIbo = None
+        self.satIndexCount = 0
+        self.satAntennaFirst = 0
+        self._satInstVbo = None
+        self._satInstCapacity = 0
+
+        # Python-side matrices replacing the fixed-function matrix stacks
+        self._proj = QtGui.QMatrix4x4()
+        self._view = QtGui.QMatrix4x4()
+        self._mvp = QtGui.QMatrix4x4()
 
         # View controls
         self.xRot = 20.0
         self.yRot = -30.0
+        self.zoom = 1.0  # camera distance factor, changed with the mouse wheel
         self.lastPos = None
 
-        # Timing for animation
-        self.start_time = QtCore.QTime.currentTime()
+        # Timing for animation; the timer only advances the satellite and asks for a
+        # repaint when something visible changed
+        self._last_pos = None
+        self._dirty = True
+        self._paused = False
+        self._repaint_pending = False  # coalesces mouse-driven repaints to one per frame
+        self._clock = QtCore.QElapsedTimer()  # monotonic, unaffected by wall-clock jumps
+        self._clock.start()
         self.timer = QtCore.QTimer(self)
-        self.timer.timeout.connect(self.update)  # call paintGL via update()
+        self.timer.timeout.connect(self._tick)
         self.timer.start(16)  # ~60 FPS
 
+    @property
+    def paused(self):
+        """When True the animation timer is stopped and the widget only repaints on demand."""
+        return self._paused
+
+    @paused.setter
+    def paused(self, value):
+        self._paused = bool(value)
+        if self._paused:
+            self.timer.stop()
+        else:
+            self.timer.start(16)
+
+    def _tick(self):
+        if not self._has_orbit:
+            moved = False
+        else:
+            pos = self.get_satellite_position()
+            last = self._last_pos if self._last_pos is not None else (0.0, 0.0, 0.0)
+            moved = np.hypot(pos[0] - last[0], pos[1] - last[1]) > self.earth_radius * 1e-4
+            if moved:
+                self._last_pos = pos
+        if moved or self._dirty:
+            self._dirty = False
+            self.update()
+
+    def _set_orbit(self, true_anomaly, radius):
+        """Replace the orbit arrays (degrees, scene units) and everything derived from them."""
+        self.orbit_true_anomaly = np.asarray(true_anomaly, dtype=np.float32) if true_anomaly is not None else None
+        self.orbit_radius = np.asarray(radius, dtype=np.float32) if radius is not None else None
+        self._has_orbit = (self.orbit_true_anomaly is not None and self.orbit_radius is not None
+                           and len(self.orbit_true_anomaly) >= 2)
+        self._refresh_orbit_cache()
+        self._dirty = True
+
+    def _refresh_orbit_cache(self):
+        """Recompute everything derived from orbit_true_anomaly/orbit_radius.
+
+        Must be called whenever the orbit arrays are replaced; the VBO is re-uploaded
+        on the next draw.
+        """
+        if self.orbit_true_anomaly is None or self.orbit_radius is None:
+            self._cos_ta = self._sin_ta = self._ta_unwrapped = self._orbit_xyz = None
+            return
+        theta = self.orbit_true_anomaly * _DEG2RAD  # float32 in, float32 out
+        # monotonic angle, so interpolating between samples never needs a +-180 fixup
+        self._ta_unwrapped = np.unwrap(theta)
+        self._cos_ta = np.cos(theta)
+        self._sin_ta = np.sin(theta)
+        self._orbit_xyz = np.column_stack((self.orbit_radius * self._cos_ta,
+                                           self.orbit_radius * self._sin_ta,
+                                           np.zeros_like(self.orbit_radius)))
+        self._orbit_dirty = True
+        self._orbit_lod_dirty = True
+
     # ---------------------------
     # OpenGL setup
     # ---------------------------
     def initializeGL(self):
         glEnable(GL_DEPTH_TEST)
-        glEnable(GL_TEXTURE_2D)
         glClearColor(self.space_color[0], self.space_color[1], self.space_color[2], 1.0)
 
+        self.earthProgram = build_program(EARTH_VERT_330, EARTH_FRAG_330, parent=self)
+        self.flatProgram = build_program(FLAT_VERT_330, FLAT_FRAG_330, parent=self)
+        self.satProgram = build_program(_SAT_VERT, FLAT_FRAG_330, parent=self)
+
         # load texture
         try:
-            img = Image.open(self.texture_path).transpose(Image.FLIP_TOP_BOTTOM).convert("RGB")
-            img_data = np.array(img, dtype=np.uint8)
+            # RGBA rows are always 4-byte aligned, so the upload needs no repacking
+            img = Image.open(self.texture_path).transpose(Image.FLIP_TOP_BOTTOM).convert("RGBA")
+            img_data = np.ascontiguousarray(np.asarray(img, dtype=np.uint8))
             self.earthTexture = glGenTextures(1)
+            glPixelStorei(GL_UNPACK_ALIGNMENT, 4)
             glBindTexture(GL_TEXTURE_2D, self.earthTexture)
-            glTexImage2D(GL_TEXTURE_2D, 0, GL_RGB, img.width, img.height, 0, GL_RGB, GL_UNSIGNED_BYTE, img_data)
-            glTexParameterf(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
-            glTexParameterf(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
+            glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA8, img.width, img.height, 0, GL_RGBA, GL_UNSIGNED_BYTE, img_data)
+            glGenerateMipmap(GL_TEXTURE_2D)
+            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR_MIPMAP_LINEAR)
+            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
         except Exception as e:
             print("Failed to load texture:", e)
             self.earthTexture = None
 
-        # lighting
-        glEnable(GL_LIGHTING)
-        glEnable(GL_LIGHT0)
-        glLightfv(GL_LIGHT0, GL_POSITION, (5.0, 5.0, 10.0, 1.0))
-        glLightfv(GL_LIGHT0, GL_AMBIENT, (0.25, 0.25, 0.25, 1.0))
-        glLightfv(GL_LIGHT0, GL_DIFFUSE, (1.0, 1.0, 1.0, 1.0))
+        # constant uniforms live in the program object, so they are set once here
+        prog = self.earthProgram
+        prog.bind()
+        prog.setUniformValue("uLightPos", QtGui.QVector3D(*_LIGHT_POS))
+        prog.setUniformValue("uLightAmbient", QtGui.QVector3D(*_LIGHT_AMB))
+        prog.setUniformValue("uLightDiffuse", QtGui.QVector3D(*_LIGHT_DIF))
+        prog.setUniformValue("uUseTexture", bool(self.earthTexture))
+        prog.setUniformValue("uEarthTex", 0)
+        prog.release()
+
+        # static Earth mesh: interleaved pos[3] + norm[3] + uv[2] (32 bytes per vertex)
+        self._upload_sphere(64, 64)
+
+        # orbit line lives in GPU memory; only the MVP changes per frame
+        self.orbitVao = glGenVertexArrays(1)
+        self.orbitVbo, self.orbitIbo = glGenBuffers(2)
+        glBindVertexArray(self.orbitVao)
+        glBindBuffer(GL_ARRAY_BUFFER, self.orbitVbo)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, self.orbitIbo)  # decimated index list, see _decimate_orbit
+        glEnableVertexAttribArray(0)
+        glVertexAttribPointer(0, 3, GL_FLOAT, GL_FALSE, 0, None)
+        glBindVertexArray(0)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        self._upload_orbit()
+
+        # satellite mesh: interleaved pos[3] + color[3], plus a per-instance position
+        # buffer so every satellite is drawn by one instanced call
+        positions, colors, indices = _unit_satellite_mesh()
+        vertices = np.ascontiguousarray(np.hstack([positions, colors]), dtype=np.float32)
+        self.satVao = glGenVertexArrays(1)
+        self.satVbo, self.satIbo, self._satInstVbo = glGenBuffers(3)
+        glBindVertexArray(self.satVao)
+        glBindBuffer(GL_ARRAY_BUFFER, self.satVbo)
+        glBufferData(GL_ARRAY_BUFFER, vertices.nbytes, vertices, GL_STATIC_DRAW)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, self.satIbo)
+        glBufferData(GL_ELEMENT_ARRAY_BUFFER, indices.nbytes, indices, GL_STATIC_DRAW)
+        glEnableVertexAttribArray(0)
+        glVertexAttribPointer(0, 3, GL_FLOAT, GL_FALSE, 24, ctypes.c_void_p(0))
+        glEnableVertexAttribArray(1)
+        glVertexAttribPointer(1, 3, GL_FLOAT, GL_FALSE, 24, ctypes.c_void_p(12))
+        glBindBuffer(GL_ARRAY_BUFFER, self._satInstVbo)
+        glEnableVertexAttribArray(2)
+        glVertexAttribPointer(2, 3, GL_FLOAT, GL_FALSE, 0, None)
+        glVertexAttribDivisor(2, 1)
+        glBindVertexArray(0)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        self.satIndexCount = len(indices)
+        self.satAntennaFirst = len(positions) - 2
+
+    def _upload_orbit(self):
+        if self._orbit_xyz is not None:
+            glBindBuffer(GL_ARRAY_BUFFER, self.orbitVbo)
+            glBufferData(GL_ARRAY_BUFFER, self._orbit_xyz.nbytes, self._orbit_xyz, GL_STATIC_DRAW)
+            glBindBuffer(GL_ARRAY_BUFFER, 0)
+        self._orbit_dirty = False
+
+    def _decimate_orbit(self, verts, tol_px):
+        """Indices of a stride-decimated orbit whose samples are about tol_px apart on screen.
+
+        Uses the current MVP and widget size; falls back to every vertex when part of the
+        orbit is behind the camera.
+        """
+        N = len(verts)
+        mvp = np.array(self._mvp.data(), dtype=np.float64).reshape(4, 4)  # column-major, i.e. transposed
+        clip = verts @ mvp[:3] + mvp[3]
+        w = clip[:, 3]
+        if N < 3 or np.any(w <= 1e-6):
+            return np.arange(N, dtype=np.uint32)
+        px = clip[:, :2] / w[:, None] * (0.5 * self.width(), 0.5 * self.height())
+        perimeter = np.hypot(*np.diff(px, axis=0).T).sum()
+        max_vertices = max(2, int(perimeter / max(tol_px, 1e-3)))
+        stride = max(1, N // max_vertices)
+        indices = np.arange(0, N, stride, dtype=np.uint32)
+        if indices[-1] != N - 1:
+            indices = np.append(indices, np.uint32(N - 1))
+        return indices
+
+    def _upload_orbit_lod(self):
+        indices = self._decimate_orbit(self._orbit_xyz, self.orbit_tolerance_px)
+        glBindVertexArray(self.orbitVao)
+        glBufferData(GL_ELEMENT_ARRAY_BUFFER, indices.nbytes, indices, GL_STATIC_DRAW)
+        glBindVertexArray(0)
+        self.orbitIndexCount = len(indices)
+        self._orbit_lod_dirty = False
+
+    def _upload_sphere(self, slices, stacks):
+        positions, normals, uvs, indices = build_sphere(self.earth_radius, slices, stacks)
+        vertices = np.ascontiguousarray(np.hstack([positions, normals, uvs]), dtype=np.float32)
+        stride = 32
+        self.sphereVao = glGenVertexArrays(1)
+        self.sphereVbo, self.sphereIbo = glGenBuffers(2)
+        glBindVertexArray(self.sphereVao)
+        glBindBuffer(GL_ARRAY_BUFFER, self.sphereVbo)
+        glBufferData(GL_ARRAY_BUFFER, vertices.nbytes, vertices, GL_STATIC_DRAW)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, self.sphereIbo)
+        glBufferData(GL_ELEMENT_ARRAY_BUFFER, indices.nbytes, indices, GL_STATIC_DRAW)
+        glEnableVertexAttribArray(0)
+        glVertexAttribPointer(0, 3, GL_FLOAT, GL_FALSE, stride, ctypes.c_void_p(0))
+        glEnableVertexAttribArray(1)
+        glVertexAttribPointer(1, 3, GL_FLOAT, GL_FALSE, stride, ctypes.c_void_p(12))
+        glEnableVertexAttribArray(2)
+        glVertexAttribPointer(2, 2, GL_FLOAT, GL_FALSE, stride, ctypes.c_void_p(24))
+        glBindVertexArray(0)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        self.sphereIndexCount = len(indices)
+
+    def draw_earth(self):
+        prog = self.earthProgram
+        prog.bind()
+        prog.setUniformValue("uMVP", self._mvp)
+        prog.setUniformValue("uModelView", self._view)
+        prog.setUniformValue("uNormalMatrix", self._view.normalMatrix())
+        if self.earthTexture:
+            glActiveTexture(GL_TEXTURE0)
+            glBindTexture(GL_TEXTURE_2D, self.earthTexture)
+        glBindVertexArray(self.sphereVao)
+        glDrawElements(GL_TRIANGLE_STRIP, self.sphereIndexCount, GL_UNSIGNED_INT, None)
+        glBindVertexArray(0)
+        prog.release()
 
     def resizeGL(self, w, h):
         h = max(1, h)
-        glViewport(0, 0, w, h)
-        glMatrixMode(GL_PROJECTION)
-        glLoadIdentity()
-        gluPerspective(45.0, w / float(h), 0.1, 200.0)
-        glMatrixMode(GL_MODELVIEW)
-        glLoadIdentity()
+        self._proj = QtGui.QMatrix4x4()
+        self._proj.perspective(45.0, w / float(h), 0.1, 200.0)
+        self._orbit_lod_dirty = True
 
     # ---------------------------
     # Main render
     # ---------------------------
     def paintGL(self):
         glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
-        glLoadIdentity()
 
         # camera distance scales with Earth radius so Earth is visible
-        cam_dist = max(5.0, 6.0 * self.earth_radius)
-        glTranslatef(0.0, 0.0, -cam_dist)
+        cam_dist = max(5.0, 6.0 * self.earth_radius) * self.zoom
+        view = QtGui.QMatrix4x4()
+        view.translate(0.0, 0.0, -cam_dist)
 
         # rotate scene by user mouse
-        glRotatef(self.xRot, 1.0, 0.0, 0.0)
-        glRotatef(self.yRot, 0.0, 1.0, 0.0)
+        view.rotate(self.xRot, 1.0, 0.0, 0.0)
+        view.rotate(self.yRot, 0.0, 1.0, 0.0)
+        self._view = view
+        self._mvp = self._proj * view
 
         # draw Earth
-        if self.earthTexture:
-            glBindTexture(GL_TEXTURE_2D, self.earthTexture)
+        self.draw_earth()
 
-        quad = gluNewQuadric()
-        gluQuadricTexture(quad, GL_TRUE if self.earthTexture else GL_FALSE)
-        gluSphere(quad, self.earth_radius, 64, 64)
-        gluDeleteQuadric(quad)
-
-        # draw orbit
-        if self.orbit_true_anomaly is not None and self.orbit_radius is not None and len(self.orbit_true_anomaly) >= 2:
+        # draw orbit and animated satellite marker (modern)
+        if self._has_orbit:
             self.draw_orbit()
-
-        # draw animated satellite marker (modern)
-        if self.orbit_true_anomaly is not None and self.orbit_radius is not None and len(self.orbit_true_anomaly) >= 2:
             self.draw_satellite_marker()
 
     # ---------------------------
     # Orbit drawing (line)
     # ---------------------------
     def draw_orbit(self):
-        glDisable(GL_LIGHTING)
-        glColor3f(*self.orbit_color)
-        glLineWidth(2.0)
-        glBegin(GL_LINE_STRIP)
-        for ta, r in zip(self.orbit_true_anomaly, self.orbit_radius):
-            x = r * np.cos(np.radians(ta))
-            y = r * np.sin(np.radians(ta))
-            z = 0.0
-            glVertex3f(x, y, z)
-        glEnd()
-        glEnable(GL_LIGHTING)
+        if self._orbit_dirty:
+            self._upload_orbit()
+        if self._orbit_lod_dirty:
+            self._upload_orbit_lod()
+        self.flatProgram.bind()
+        self.flatProgram.setUniformValue("uMVP", self._mvp)
+        glBindVertexArray(self.orbitVao)
+        # attribute 1 is not an array here, so it keeps this constant color
+        glVertexAttrib3f(1, *self.orbit_color)
+        glDrawElements(GL_LINE_STRIP, self.orbitIndexCount, GL_UNSIGNED_INT, None)
+        glBindVertexArray(0)
+        self.flatProgram.release()
 
     # ---------------------------
     # Satellite animation interpolation
     # ---------------------------
-    def get_satellite_position(self):
-        """Return (x,y,z) interpolated along the provided orbit arrays based on current time and satellite_period."""
+    def get_satellite_position(self, fraction=None):
+        """Return (x,y,z) interpolated along the provided orbit arrays.
+
+        fraction is the orbit phase in [0, 1); by default it is derived from the current
+        time and satellite_period. A NumPy array of fractions is evaluated in one
+        vectorized pass and x, y, z are returned as arrays of the same shape.
+        """
         N = len(self.orbit_true_anomaly)
         if N < 2:
             return (0.0, 0.0, 0.0)
 
-        elapsed_s = self.start_time.msecsTo(QtCore.QTime.currentTime()) / 1000.0
-        if self.satellite_period <= 0:
-            fraction = 0.0
-        else:
-            fraction = (elapsed_s % self.satellite_period) / self.satellite_period
+        if fraction is None:
+            fraction = self._orbit_fraction()
+        scalar = np.ndim(fraction) == 0
+        fraction = np.asarray(fraction, dtype=np.float64)
 
         # continuous index across the orbit points
         idx_float = fraction * (N - 1)
-        idx0 = int(np.floor(idx_float)) % N
+        base = np.floor(idx_float)
+        idx0 = base.astype(np.int64) % N
         idx1 = (idx0 + 1) % N
-        t = idx_float - np.floor(idx_float)
-
-        ta0 = float(self.orbit_true_anomaly[idx0])
-        ta1 = float(self.orbit_true_anomaly[idx1])
-        # handle wrap-around of angle (e.g., 350 -> 10 deg)
-        dta = ((ta1 - ta0 + 180.0) % 360.0) - 180.0
-        ta = ta0 + dta * t
-
-        r0 = float(self.orbit_radius[idx0])
-        r1 = float(self.orbit_radius[idx1])
-        r = r0 + (r1 - r0) * t
-
-        x = r * np.cos(np.radians(ta))
-        y = r * np.sin(np.radians(ta))
-        z = 0.0
+        t = (idx_float - base).astype(np.float32)  # phase stays float64, geometry is float32
+
+        # lerp angle and radius between neighbouring samples, then go to Cartesian
+        ta0 = self._ta_unwrapped[idx0]
+        r0 = self.orbit_radius[idx0]
+        ta = ta0 + (self._ta_unwrapped[idx1] - ta0) * t
+        r = r0 + (self.orbit_radius[idx1] - r0) * t
+        x = r * np.cos(ta)
+        y = r * np.sin(ta)
+        z = np.zeros_like(x)
+        if scalar:
+            return (float(x), float(y), 0.0)
         return (x, y, z)
 
+    def _orbit_fraction(self):
+        """Current orbit phase in [0, 1) from elapsed time and satellite_period."""
+        elapsed_s = self._clock.elapsed() * 1e-3
+        if self.satellite_period <= 0:
+            return 0.0
+        return (elapsed_s % self.satellite_period) / self.satellite_period
+
     # ---------------------------
     # Satellite marker (modern: cube + solar panels)
     # ---------------------------
+    def _compute_all_satellite_positions(self, fractions):
+        """Positions of every satellite as a contiguous float32 (N, 3) array."""
+        x, y, z = self.get_satellite_position(np.asarray(fractions, dtype=np.float64) % 1.0)
+        return np.column_stack((x, y, z))
+
     def draw_satellite_marker(self):
-        x, y, z = self.get_satellite_position()
+        positions = self._compute_all_satellite_positions(self._orbit_fraction() + self.satellite_phases)
+        count = len(positions)
+        if count == 0:
+            return
 
-        glPushMatrix()
-        glTranslatef(x, y, z)
+        # only the small instance buffer is uploaded per frame; it grows on demand
+        glBindBuffer(GL_ARRAY_BUFFER, self._satInstVbo)
+        if count > self._satInstCapacity:
+            glBufferData(GL_ARRAY_BUFFER, positions.nbytes, positions, GL_DYNAMIC_DRAW)
+            self._satInstCapacity = count
+        else:
+            glBufferSubData(GL_ARRAY_BUFFER, 0, positions.nbytes, positions)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
 
         # optionally orient marker to velocity or radial direction in future; for now it's axis-aligned
-
-        # disable textures + lighting for flat colors, then re-enable after
-        glDisable(GL_TEXTURE_2D)
-        glDisable(GL_LIGHTING)
-
-        # satellite body (cube)
         size = max(0.01 * self.earth_radius, self.earth_radius * 0.03)  # scale with Earth
-        self._draw_colored_cube(size, (0.85, 0.85, 0.85))
-
-        # solar panels (two thin rectangles)
-        panel_w = size * 2.6
-        panel_h = size * 0.45
-        panel_thickness = 0.002 * self.earth_radius
-        self._draw_solar_panel(-size - panel_w/2.0, 0.0, 0.0, panel_w, panel_h, panel_thickness, (0.12, 0.18, 0.55))
-        self._draw_solar_panel(size + panel_w/2.0, 0.0, 0.0, panel_w, panel_h, panel_thickness, (0.12, 0.18, 0.55))
-
-        # small antenna or bus detail
-        glColor3f(0.2, 0.2, 0.2)
-        glBegin(GL_LINES)
-        glVertex3f(0.0, size, 0.0)
-        glVertex3f(0.0, size + size*0.6, 0.0)
-        glEnd()
-
-        glEnable(GL_LIGHTING)
-        glEnable(GL_TEXTURE_2D)
-        glPopMatrix()
-
-    def _draw_colored_cube(self, size, color):
-        """Draw a cube centered at origin with face color"""
-        hs = size * 0.5
-        glColor3f(*color)
-        glBegin(GL_QUADS)
-        # +Z face
-        glVertex3f(-hs, -hs, hs)
-        glVertex3f(hs, -hs, hs)
-        glVertex3f(hs, hs, hs)
-        glVertex3f(-hs, hs, hs)
-        # -Z face
-        glVertex3f(-hs, -hs, -hs)
-        glVertex3f(-hs, hs, -hs)
-        glVertex3f(hs, hs, -hs)
-        glVertex3f(hs, -hs, -hs)
-        # +Y face
-        glVertex3f(-hs, hs, -hs)
-        glVertex3f(-hs, hs, hs)
-        glVertex3f(hs, hs, hs)
-        glVertex3f(hs, hs, -hs)
-        # -Y face
-        glVertex3f(-hs, -hs, -hs)
-        glVertex3f(hs, -hs, -hs)
-        glVertex3f(hs, -hs, hs)
-        glVertex3f(-hs, -hs, hs)
-        # +X face
-        glVertex3f(hs, -hs, -hs)
-        glVertex3f(hs, hs, -hs)
-        glVertex3f(hs, hs, hs)
-        glVertex3f(hs, -hs, hs)
-        # -X face
-        glVertex3f(-hs, -hs, -hs)
-        glVertex3f(-hs, -hs, hs)
-        glVertex3f(-hs, hs, hs)
-        glVertex3f(-hs, hs, -hs)
-        glEnd()
-
-    def _draw_solar_panel(self, cx, cy, cz, width, height, thickness, color):
-        """Draws a thin rectangular panel centered at (cx,cy,cz) oriented in Y-Z plane (flat along X)."""
-        hw = width * 0.5
-        hh = height * 0.5
-        ht = thickness * 0.5
-        glColor3f(*color)
-        # front face
-        glBegin(GL_QUADS)
-        glVertex3f(cx - hw, cy - hh, cz + ht)
-        glVertex3f(cx + hw, cy - hh, cz + ht)
-        glVertex3f(cx + hw, cy + hh, cz + ht)
-        glVertex3f(cx - hw, cy + hh, cz + ht)
-        # back face
-        glVertex3f(cx - hw, cy - hh, cz - ht)
-        glVertex3f(cx - hw, cy + hh, cz - ht)
-        glVertex3f(cx + hw, cy + hh, cz - ht)
-        glVertex3f(cx + hw, cy - hh, cz - ht)
-        # sides
-        glVertex3f(cx - hw, cy - hh, cz - ht)
-        glVertex3f(cx - hw, cy - hh, cz + ht)
-        glVertex3f(cx - hw, cy + hh, cz + ht)
-        glVertex3f(cx - hw, cy + hh, cz - ht)
-
-        glVertex3f(cx + hw, cy - hh, cz - ht)
-        glVertex3f(cx + hw, cy + hh, cz - ht)
-        glVertex3f(cx + hw, cy + hh, cz + ht)
-        glVertex3f(cx + hw, cy - hh, cz + ht)
-
-        glVertex3f(cx - hw, cy + hh, cz - ht)
-        glVertex3f(cx - hw, cy + hh, cz + ht)
-        glVertex3f(cx + hw, cy + hh, cz + ht)
-        glVertex3f(cx + hw, cy + hh, cz - ht)
-
-        glVertex3f(cx - hw, cy - hh, cz - ht)
-        glVertex3f(cx + hw, cy - hh, cz - ht)
-        glVertex3f(cx + hw, cy - hh, cz + ht)
-        glVertex3f(cx - hw, cy - hh, cz + ht)
-        glEnd()
+        self.satProgram.bind()
+        self.satProgram.setUniformValue("uMVP", self._mvp)
+        self.satProgram.setUniformValue("uSize", size)
+        glBindVertexArray(self.satVao)
+        glDrawElementsInstanced(GL_TRIANGLES, self.satIndexCount, GL_UNSIGNED_INT, None, count)
+        glDrawArraysInstanced(GL_LINES, self.satAntennaFirst, 2, count)  # antenna
+        glBindVertexArray(0)
+        self.satProgram.release()
 
     # ---------------------------
     # Mouse interaction
     # ---------------------------
+    def _schedule_repaint(self):
+        if not self._repaint_pending:
+            self._repaint_pending = True
+            QtCore.QTimer.singleShot(16, self._do_repaint)
+
+    def _do_repaint(self):
+        self._repaint_pending = False
+        # the view changed (drag or zoom): re-decimate for it, at most once per coalesced frame
+        self._orbit_lod_dirty = True
+        self.update()
+
     def mousePressEvent(self, event):
         self.lastPos = event.pos()
 
+    def mouseReleaseEvent(self, event):
+        # final re-decimation for the resting view
+        self._orbit_lod_dirty = True
+        self._schedule_repaint()
+
+    def wheelEvent(self, event):
+        # 120 units per wheel step, 0.9x distance per step forward, clamped
+        self.zoom *= 0.9 ** (event.angleDelta().y() / 120.0)
+        self.zoom = max(0.3, min(self.zoom, 3.0))
+        self._dirty = True
+        self._schedule_repaint()
+
     def mouseMoveEvent(self, event):
         if self.lastPos is None:
             self.lastPos = event.pos()
@@ -300,7 +528,8 @@ class EarthOrbitViewer(QtOpenGL.QGLWidget):
         if event.buttons() & QtCore.Qt.LeftButton:
             self.xRot += dy * 0.5
             self.yRot += dx * 0.5
-            self.update()
+            self._dirty = True
+            self._schedule_repaint()
         self.lastPos = event.pos()
 
 
@@ -1,114 +1,246 @@
 import sys
+import ctypes
 import numpy as np
-from PyQt5 import QtWidgets, QtOpenGL, QtCore
+from PyQt5 import QtWidgets, QtCore, QtGui
+import OpenGL
+# Drawing already goes through a handful of VAO calls per frame; skip PyOpenGL's
+# glGetError round-trip after each one (must be set before OpenGL.GL is imported).
+OpenGL.ERROR_CHECKING = False
 from OpenGL.GL import *
-from OpenGL.GLU import *
 from PIL import Image
+from orbit_pyqtgraph._glutil import (EARTH_VERT_330, EARTH_FRAG_330, FLAT_VERT_330, FLAT_FRAG_330,
+                                     build_program, build_sphere)
 
+_DEG2RAD = np.pi / 180.0
 
-class EarthOrbitViewer(QtOpenGL.QGLWidget):
+# Light parameters (eye space); uploaded to the Earth program once in initializeGL
+_LIGHT_POS = (0.0, 0.0, 10.0)
+_LIGHT_AMB = (0.2, 0.2, 0.2)
+_LIGHT_DIF = (1.0, 1.0, 1.0)
+
+
+class EarthOrbitViewer(QtWidgets.QOpenGLWidget):
     def __init__(self, earth_diameter=1.0, space_color=(0.0, 0.0, 0.0), texture_path="earth.jpg",
                  orbit_true_anomaly=None, orbit_radius=None, orbit_color=(1.0, 1.0, 0.0),
                  parent=None):
         super(EarthOrbitViewer, self).__init__(parent)
+        fmt = QtGui.QSurfaceFormat()
+        fmt.setVersion(3, 3)
+        fmt.setProfile(QtGui.QSurfaceFormat.CoreProfile)
+        fmt.setDepthBufferSize(24)
+        self.setFormat(fmt)
 
         # Parameters
         self.earth_radius = earth_diameter / 2.0
         self.space_color = space_color
         self.texture_path = texture_path
-        self.orbit_true_anomaly = np.array(orbit_true_anomaly) if orbit_true_anomaly is not None else None
-        self.orbit_radius = np.array(orbit_radius) if orbit_radius is not None else None
         self.orbit_color = orbit_color
 
+        # Orbit arrays, cached trig of the true anomaly and the (N, 3) float32 orbit vertices
+        self.orbit_true_anomaly = None
+        self.orbit_radius = None
+        self._cos_ta = None
+        self._sin_ta = None
+        self._orbit_xyz = None
+        self._orbit_dirty = False
+        self._has_orbit = False
+        self._set_orbit(orbit_true_anomaly, orbit_radius)
+
         # View rotation
         self.xRot = 0
         self.yRot = 0
         self.lastPos = None
+        self._repaint_pending = False  # coalesces mouse-driven repaints to one per frame
 
-        # GL resources
+        # GL resources (one VAO per object)
         self.earthTexture = None
+        self.earthProgram = None
+        self.flatProgram = None
+        self.orbitVao = None
+        self.orbitVbo = None
+        self.sphereVao = None
+        self.sphereVbo = None
+        self.sphereIbo = None
+        self.sphereIndexCount = 0
+        self.markerVao = None
+        self.markerVbo = None
+        self.markerIbo = None
+        self.markerIndexCount = 0
+
+        # Python-side matrices replacing the fixed-function matrix stacks
+        self._proj = QtGui.QMatrix4x4()
+        self._view = QtGui.QMatrix4x4()
+        self._mvp = QtGui.QMatrix4x4()
+
+    def _set_orbit(self, true_anomaly, radius):
+        """Replace the orbit arrays and everything derived from them."""
+        self.orbit_true_anomaly = np.asarray(true_anomaly, dtype=np.float32) if true_anomaly is not None else None
+        self.orbit_radius = np.asarray(radius, dtype=np.float32) if radius is not None else None
+        self._has_orbit = (self.orbit_true_anomaly is not None and self.orbit_radius is not None
+                           and len(self.orbit_true_anomaly) >= 2)
+        self._refresh_orbit_cache()
+
+    def _refresh_orbit_cache(self):
+        """Recompute trig tables and vertices; call after replacing the orbit arrays."""
+        if self.orbit_true_anomaly is None or self.orbit_radius is None:
+            self._cos_ta = self._sin_ta = self._orbit_xyz = None
+            return
+        theta = self.orbit_true_anomaly * _DEG2RAD  # float32 in, float32 out
+        self._cos_ta = np.cos(theta)
+        self._sin_ta = np.sin(theta)
+        self._orbit_xyz = np.column_stack((self.orbit_radius * self._cos_ta,
+                                           self.orbit_radius * self._sin_ta,
+                                           np.zeros_like(self.orbit_radius)))
+        self._orbit_dirty = True
 
     def initializeGL(self):
         glEnable(GL_DEPTH_TEST)
-        glEnable(GL_TEXTURE_2D)
         glClearColor(*self.space_color, 1.0)  # background color
 
+        self.earthProgram = build_program(EARTH_VERT_330, EARTH_FRAG_330, parent=self)
+        self.flatProgram = build_program(FLAT_VERT_330, FLAT_FRAG_330, parent=self)
+
         # Load Earth texture
-        img = Image.open(self.texture_path).transpose(Image.FLIP_TOP_BOTTOM).convert("RGB")
-        img_data = np.array(img, dtype=np.uint8)
+        img = Image.open(self.texture_path).transpose(Image.FLIP_TOP_BOTTOM).convert("RGBA")
+        img_data = np.ascontiguousarray(np.asarray(img, dtype=np.uint8))
 
         self.earthTexture = glGenTextures(1)
+        glPixelStorei(GL_UNPACK_ALIGNMENT, 4)
         glBindTexture(GL_TEXTURE_2D, self.earthTexture)
-        glTexImage2D(GL_TEXTURE_2D, 0, GL_RGB, img.width, img.height, 0, GL_RGB, GL_UNSIGNED_BYTE, img_data)
-        glTexParameterf(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
-        glTexParameterf(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
+        glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA8, img.width, img.height, 0, GL_RGBA, GL_UNSIGNED_BYTE, img_data)
+        glGenerateMipmap(GL_TEXTURE_2D)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR_MIPMAP_LINEAR)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
 
-        # Lighting
-        glEnable(GL_LIGHTING)
-        glEnable(GL_LIGHT0)
-        glLightfv(GL_LIGHT0, GL_POSITION, (0, 0, 10, 1))
-        glLightfv(GL_LIGHT0, GL_AMBIENT, (0.2, 0.2, 0.2, 1.0))
-        glLightfv(GL_LIGHT0, GL_DIFFUSE, (1.0, 1.0, 1.0, 1.0))
+        # constant uniforms live in the program object, so they are set once here
+        prog = self.earthProgram
+        prog.bind()
+        prog.setUniformValue("uLightPos", QtGui.QVector3D(*_LIGHT_POS))
+        prog.setUniformValue("uLightAmbient", QtGui.QVector3D(*_LIGHT_AMB))
+        prog.setUniformValue("uLightDiffuse", QtGui.QVector3D(*_LIGHT_DIF))
+        prog.setUniformValue("uUseTexture", True)
+        prog.setUniformValue("uEarthTex", 0)
+        prog.release()
+
+        # Earth mesh VBO/IBO (pos[3] + norm[3] + uv[2] interleaved)
+        positions, normals, uvs, indices = build_sphere(self.earth_radius, 50, 50)
+        vertices = np.ascontiguousarray(np.hstack([positions, normals, uvs]), dtype=np.float32)
+        self.sphereVao = glGenVertexArrays(1)
+        self.sphereVbo, self.sphereIbo = glGenBuffers(2)
+        glBindVertexArray(self.sphereVao)
+        glBindBuffer(GL_ARRAY_BUFFER, self.sphereVbo)
+        glBufferData(GL_ARRAY_BUFFER, vertices.nbytes, vertices, GL_STATIC_DRAW)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, self.sphereIbo)
+        glBufferData(GL_ELEMENT_ARRAY_BUFFER, indices.nbytes, indices, GL_STATIC_DRAW)
+        glEnableVertexAttribArray(0)
+        glVertexAttribPointer(0, 3, GL_FLOAT, GL_FALSE, 32, ctypes.c_void_p(0))
+        glEnableVertexAttribArray(1)
+        glVertexAttribPointer(1, 3, GL_FLOAT, GL_FALSE, 32, ctypes.c_void_p(12))
+        glEnableVertexAttribArray(2)
+        glVertexAttribPointer(2, 2, GL_FLOAT, GL_FALSE, 32, ctypes.c_void_p(24))
+        glBindVertexArray(0)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        self.sphereIndexCount = len(indices)
+
+        # Marker mesh: small unit sphere, positions only (color is a constant attribute);
+        # 12x12 is indistinguishable from 20x20 at marker size with a third of the triangles
+        positions, _, _, indices = build_sphere(1.0, 12, 12)
+        self.markerVao = glGenVertexArrays(1)
+        self.markerVbo, self.markerIbo = glGenBuffers(2)
+        glBindVertexArray(self.markerVao)
+        glBindBuffer(GL_ARRAY_BUFFER, self.markerVbo)
+        glBufferData(GL_ARRAY_BUFFER, positions.nbytes, positions, GL_STATIC_DRAW)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, self.markerIbo)
+        glBufferData(GL_ELEMENT_ARRAY_BUFFER, indices.nbytes, indices, GL_STATIC_DRAW)
+        glEnableVertexAttribArray(0)
+        glVertexAttribPointer(0, 3, GL_FLOAT, GL_FALSE, 0, None)
+        glBindVertexArray(0)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        self.markerIndexCount = len(indices)
+
+        # Orbit VBO
+        self.orbitVao = glGenVertexArrays(1)
+        self.orbitVbo = glGenBuffers(1)
+        glBindVertexArray(self.orbitVao)
+        glBindBuffer(GL_ARRAY_BUFFER, self.orbitVbo)
+        glEnableVertexAttribArray(0)
+        glVertexAttribPointer(0, 3, GL_FLOAT, GL_FALSE, 0, None)
+        glBindVertexArray(0)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        self._upload_orbit()
+
+    def _upload_orbit(self):
+        if self._orbit_xyz is not None:
+            glBindBuffer(GL_ARRAY_BUFFER, self.orbitVbo)
+            glBufferData(GL_ARRAY_BUFFER, self._orbit_xyz.nbytes, self._orbit_xyz, GL_STATIC_DRAW)
+            glBindBuffer(GL_ARRAY_BUFFER, 0)
+        self._orbit_dirty = False
 
     def resizeGL(self, w, h):
-        glViewport(0, 0, w, h)
-        glMatrixMode(GL_PROJECTION)
-        glLoadIdentity()
-        gluPerspective(45.0, w / float(h or 1), 0.1, 100.0)
-        glMatrixMode(GL_MODELVIEW)
-        glLoadIdentity()
+        self._proj = QtGui.QMatrix4x4()
+        self._proj.perspective(45.0, w / float(h or 1), 0.1, 100.0)
 
     def paintGL(self):
         glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
-        glLoadIdentity()
-        glTranslatef(0.0, 0.0, -5.0)
-        glRotatef(self.xRot, 1.0, 0.0, 0.0)
-        glRotatef(self.yRot, 0.0, 1.0, 0.0)
+        view = QtGui.QMatrix4x4()
+        view.translate(0.0, 0.0, -5.0)
+        view.rotate(self.xRot, 1.0, 0.0, 0.0)
+        view.rotate(self.yRot, 0.0, 1.0, 0.0)
+        self._view = view
+        self._mvp = self._proj * view
 
         # Draw Earth
+        prog = self.earthProgram
+        prog.bind()
+        prog.setUniformValue("uMVP", self._mvp)
+        prog.setUniformValue("uModelView", self._view)
+        prog.setUniformValue("uNormalMatrix", self._view.normalMatrix())
+        glActiveTexture(GL_TEXTURE0)
         glBindTexture(GL_TEXTURE_2D, self.earthTexture)
-        quadric = gluNewQuadric()
-        gluQuadricTexture(quadric, GL_TRUE)
-        gluSphere(quadric, self.earth_radius, 50, 50)
-        gluDeleteQuadric(quadric)
+        glBindVertexArray(self.sphereVao)
+        glDrawElements(GL_TRIANGLE_STRIP, self.sphereIndexCount, GL_UNSIGNED_INT, None)
+        glBindVertexArray(0)
+        prog.release()
 
         # Draw orbit and satellite
-        if self.orbit_true_anomaly is not None and self.orbit_radius is not None:
+        if self._has_orbit:
             self.draw_orbit()
             self.draw_satellite_marker()
 
     def draw_orbit(self):
-        glDisable(GL_LIGHTING)  # orbit not affected by lighting
-        glColor3f(*self.orbit_color)
-        glBegin(GL_LINE_LOOP)
-        for ta, r in zip(self.orbit_true_anomaly, self.orbit_radius):
-            x = r * np.cos(np.radians(ta))
-            y = r * np.sin(np.radians(ta))
-            z = 0
-            glVertex3f(x, y, z)
-        glEnd()
-        glEnable(GL_LIGHTING)
+        if self._orbit_dirty:
+            self._upload_orbit()
+        self.flatProgram.bind()
+        self.flatProgram.setUniformValue("uMVP", self._mvp)
+        glBindVertexArray(self.orbitVao)
+        glVertexAttrib3f(1, *self.orbit_color)  # orbit not affected by lighting
+        glDrawArrays(GL_LINE_LOOP, 0, len(self._orbit_xyz))
+        glBindVertexArray(0)
+        self.flatProgram.release()
 
     def draw_satellite_marker(self):
         # Last orbit point
-        ta_last = self.orbit_true_anomaly[-1]
-        r_last = self.orbit_radius[-1]
-        x = r_last * np.cos(np.radians(ta_last))
-        y = r_last * np.sin(np.radians(ta_last))
-        z = 0
-
-        glDisable(GL_TEXTURE_2D)
-        glDisable(GL_LIGHTING)
-        glColor3f(1.0, 0.0, 0.0)  # red marker
-        quadric = gluNewQuadric()
-        gluSphere(quadric, self.earth_radius * 0.05, 20, 20)  # small sphere marker
-        glPushMatrix()
-        glTranslatef(x, y, z)
-        gluSphere(quadric, self.earth_radius * 0.05, 20, 20)
-        glPopMatrix()
-        gluDeleteQuadric(quadric)
-        glEnable(GL_LIGHTING)
-        glEnable(GL_TEXTURE_2D)
+        x, y, z = self._orbit_xyz[-1]
+
+        model_view = QtGui.QMatrix4x4(self._view)
+        model_view.translate(float(x), float(y), float(z))
+        model_view.scale(self.earth_radius * 0.05)  # small sphere marker
+        self.flatProgram.bind()
+        self.flatProgram.setUniformValue("uMVP", self._proj * model_view)
+        glBindVertexArray(self.markerVao)
+        glVertexAttrib3f(1, 1.0, 0.0, 0.0)  # red marker
+        glDrawElements(GL_TRIANGLE_STRIP, self.markerIndexCount, GL_UNSIGNED_INT, None)
+        glBindVertexArray(0)
+        self.flatProgram.release()
+
+    def _schedule_repaint(self):
+        if not self._repaint_pending:
+            self._repaint_pending = True
+            QtCore.QTimer.singleShot(16, self._do_repaint)
+
+    def _do_repaint(self):
+        self._repaint_pending = False
+        self.update()
 
     def mousePressEvent(self, event):
         self.lastPos = event.pos()
@@ -119,7 +251,7 @@ class EarthOrbitViewer(QtOpenGL.QGLWidget):
         if event.buttons() & QtCore.Qt.LeftButton:
             self.xRot += dy
             self.yRot += dx
-            self.update()
+            self._schedule_repaint()
         self.lastPos = event.pos()
 
 
@@ -1,24 +1,89 @@
 import pyqtgraph.opengl as gl
 import pyqtgraph as pg
-import numpy as np, math, os, time, datetime
-from PyQt5 import QtWidgets, QtCore, QtGui, QtOpenGL
+import numpy as np, math, os, time, datetime, ctypes, functools
+from PyQt5 import QtWidgets, QtCore, QtGui
 from OpenGL.GL import *
-from OpenGL.GLU import *
 from PIL import Image
 from .orb_math import *
-
-
-
-class EarthGLWidget(QtOpenGL.QGLWidget):
+from ._kernels import warmup as _warmup_kernels
+from ._glutil import build_program, build_earth_mesh
+
+
+# Earth shader (GLSL 1.20, runs on the default compatibility context next to the
+# fixed-function orbit line and marker). Lighting is done per fragment with the same
+# terms the fixed-function path produced for GL_LIGHT0 and the default material:
+# 0.2 * (light ambient + global 0.2) + 0.8 * light diffuse * max(N.L, 0).
+_EARTH_VERT = """
+#version 120
+attribute vec3 aPos;
+attribute vec3 aNormal;
+attribute vec2 aUV;
+uniform mat4 uMVP;
+uniform mat3 uNormalMatrix;
+varying vec3 vNormal;
+varying vec2 vUV;
+void main() {
+    vNormal = uNormalMatrix * aNormal;
+    vUV = aUV;
+    gl_Position = uMVP * vec4(aPos, 1.0);
+}
+"""
+
+_EARTH_FRAG = """
+#version 120
+varying vec3 vNormal;
+varying vec2 vUV;
+uniform sampler2D uEarthTex;
+uniform bool uUseTexture;
+uniform vec3 uLightDir;      // eye space, normalized
+uniform vec3 uLightAmbient;
+uniform vec3 uLightDiffuse;
+void main() {
+    vec3 n = normalize(vNormal);
+    vec3 lit = 0.2 * (uLightAmbient + vec3(0.2)) + 0.8 * uLightDiffuse * max(dot(n, uLightDir), 0.0);
+    vec4 base = uUseTexture ? texture2D(uEarthTex, vUV) : vec4(1.0);
+    gl_FragColor = vec4(base.rgb * lit, base.a);
+}
+"""
+
+
+@functools.lru_cache(maxsize=64)
+def _hex_rgb(h):
+    """'#rrggbb' -> (r, g, b) floats in 0..1, parsed once per distinct color string."""
+    h = h.lstrip('#')
+    return (int(h[0:2], 16)/255.0, int(h[2:4], 16)/255.0, int(h[4:6], 16)/255.0)
+
+
+# Earth tessellation (stacks, slices) by zoom: (zoom threshold, lod), first match wins.
+# Zoomed out (large zoom = far camera) the sphere covers few pixels and needs fewer triangles.
+_EARTH_LODS = ((2.0, (20, 40)), (0.8, (40, 80)), (0.0, (80, 160)))
+
+
+# Satellite marker solar panels (two quads, km in the marker frame)
+_MARKER_PANELS = np.array([
+    # left panel
+    (-144.0, -10.0, 10.0), (-144.0, 10.0, 10.0), (-60.0, 10.0, 10.0), (-60.0, -10.0, 10.0),
+    # right panel
+    (60.0, -10.0, 10.0), (60.0, 10.0, 10.0), (144.0, 10.0, 10.0), (144.0, -10.0, 10.0),
+], dtype=np.float32)
+
+
+class EarthGLWidget(QtWidgets.QOpenGLWidget):
     """
-    A QGLWidget that draws a textured Earth sphere and the satellite path/marker.
+    A QOpenGLWidget that draws a textured Earth sphere and the satellite path/marker.
     We avoid pyqtgraph GLMeshItem for textured Earth to reduce API incompatibilities.
+    The Earth is drawn with a shader program; the camera is a QMatrix4x4 that is also
+    loaded into the fixed-function matrices for the path and marker.
     """
     def __init__(self, parent=None, earth_texture_path="earth.jpg"):
 
-        fmt = QtOpenGL.QGLFormat()
-        fmt.setDoubleBuffer(True)
-        super().__init__(fmt, parent)
+        super().__init__(parent)
+        # QOpenGLWidget always renders into a (double-buffered) FBO; it only needs depth,
+        # and buffer swaps wait for vsync so the animation never renders unseen frames
+        fmt = QtGui.QSurfaceFormat()
+        fmt.setDepthBufferSize(24)
+        fmt.setSwapInterval(1)
+        self.setFormat(fmt)
         if not os.path.isabs(earth_texture_path):
             # Try to find the texture relative to the orbit.py file
             orbit_dir = os.path.dirname(os.path.abspath(__file__))
@@ -54,6 +119,7 @@ class EarthGLWidget(QtOpenGL.QGLWidget):
         self.angle_y = -40.0
         self.last_wheel = 0
         self.texture_id = None
+        self._texture_size = None  # (w, h) of the allocated texture storage
         self.setMinimumSize(600, 600)
         self.revolves = None
         # satellite marker size in km (visual)
@@ -61,13 +127,37 @@ class EarthGLWidget(QtOpenGL.QGLWidget):
         self.rot_x = 0.0   # vertical rotation (pitch)
         self.rot_y = 0.0   # horizontal rotation (yaw)
         self.last_mouse_pos = None
+        # (radius, stacks, slices) -> (vbo, ibo, index count), built on first draw
+        self._earth_meshes = {}
+        self._earth_program = None
+        # (body vbo, body ibo, body index count, panel vbo), built on first draw
+        self._marker_mesh = None
+        # orbit path as float32 vertices and its VBO, uploaded when the positions change
+        self._path_f32 = np.zeros((0, 3), dtype=np.float32)
+        self._path_vbo = None
+        # animation clock: while running, paintGL derives marker_index from elapsed time and
+        # each swapped frame schedules the next one (a render loop bounded by vsync)
+        self._elapsed = None
+        self._step_ms = 1.0
+        # one re-armable shot for waits longer than a frame; start() replaces a pending one
+        self._next_frame = QtCore.QTimer(self)
+        self._next_frame.setSingleShot(True)
+        self._next_frame.timeout.connect(self.update)
+        self.frameSwapped.connect(self._on_frame_swapped)
+        # projection from resizeGL, camera (view) from paintGL
+        self._proj = QtGui.QMatrix4x4()
+        self._view = QtGui.QMatrix4x4()
 
 
     def initializeGL(self):
+        # A new context (e.g. after the widget was reparented) owns none of the old GL objects
+        self._earth_meshes = {}
+        self._marker_mesh = None
+        self._path_vbo = None
+        self._texture_size = None
         # Enable depth testing so nearer objects hide farther ones
         glEnable(GL_DEPTH_TEST)
-        # Enable 2D texture mapping in OpenGL
-        glEnable(GL_TEXTURE_2D)
+        # (2D texturing is done in the Earth shader; fixed-function texturing stays off)
         # Enable smooth shading (interpolates colors across surfaces)
         glShadeModel(GL_SMOOTH)
         # Set the background (clear) color to whatever is stored in self.bgcolor
@@ -94,6 +184,17 @@ class EarthGLWidget(QtOpenGL.QGLWidget):
         self.texture_id = glGenTextures(1)
         # Load and bind the Earth texture from the provided file path
         self.bind_texture(self.earth_texture_path)
+        # Earth shader; the light is constant, so its uniforms are set once here
+        # (light_position was given with an identity modelview, i.e. it is already in eye space)
+        self._earth_program = build_program(_EARTH_VERT, _EARTH_FRAG, ("aPos", "aNormal", "aUV"), self)
+        prog = self._earth_program
+        prog.bind()
+        prog.setUniformValue("uLightDir", QtGui.QVector3D(*light_position[:3]).normalized())
+        prog.setUniformValue("uLightAmbient", QtGui.QVector3D(*ambient_light[:3]))
+        prog.setUniformValue("uLightDiffuse", QtGui.QVector3D(*diffuse_light[:3]))
+        prog.setUniformValue("uEarthTex", 0)
+        prog.setUniformValue("uUseTexture", self._texture_size is not None)
+        prog.release()
 
 
     def bind_texture(self, path):
@@ -101,54 +202,69 @@ class EarthGLWidget(QtOpenGL.QGLWidget):
         if not os.path.exists(path):
             print(f"Earth texture not found at {path}. Earth will be untextured.")
             return
-        # Load the image into a QImage object and mirror it vertically
-        # (This fixes the flipped orientation caused by OpenGL coordinate system)
-        img = QtGui.QImage(path).mirrored()
-        # Convert the image to 32-bit RGBA format so OpenGL understands it
-        img = img.convertToFormat(QtGui.QImage.Format_RGBA8888)
+        # Load the image into a QImage object as 32-bit ARGB (one 0xAARRGGBB word per pixel),
+        # QImage's native layout; GL_BGRA + GL_UNSIGNED_INT_8_8_8_8_REV reads exactly that word
+        # on any endianness, which is the drivers' no-swizzle upload path
+        img = QtGui.QImage(path).convertToFormat(QtGui.QImage.Format_ARGB32)
         # Get image dimensions
         w = img.width()
         h = img.height()
-        # Get the raw pointer to the pixel data
-        ptr = img.bits()
+        # Get the raw (read-only) pointer to the pixel data
+        ptr = img.constBits()
         # Set the size of the pointer to match the full byte size of the image
         ptr.setsize(img.byteCount())
-        # Convert pointer data to a Python bytes object
-        data = ptr.asstring()
+        # View the pixels in place (no bytes copy), rows are 4*w bytes for ARGB32
+        pixels = np.frombuffer(ptr, dtype=np.uint8).reshape(h, w, 4)
+        # Mirror vertically (fixes the flipped orientation caused by OpenGL coordinate system);
+        # this is the only full-image copy on the upload path
+        data = np.ascontiguousarray(pixels[::-1])
+        # Immutable storage can't be resized: a new image size needs a fresh texture object
+        if self._texture_size not in (None, (w, h)):
+            glDeleteTextures([self.texture_id])
+            self.texture_id = glGenTextures(1)
+            self._texture_size = None
         # Bind our pre-created OpenGL texture ID as the current texture
         glBindTexture(GL_TEXTURE_2D, self.texture_id)
-        # Set texture minification filter (scaling down)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
+        # Set texture minification filter (scaling down); mipmaps keep texel fetches cheap when zoomed out
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR_MIPMAP_LINEAR)
         # Set texture magnification filter (scaling up)
         glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
+        if self._texture_size is None:
+            # Allocate GPU storage once (full mip chain); later uploads only replace the pixels
+            levels = 1 + int(math.log2(max(w, h)))
+            if bool(glTexStorage2D):
+                glTexStorage2D(GL_TEXTURE_2D, levels, GL_RGBA8, w, h)
+            else:
+                # GL < 4.2 without ARB_texture_storage: mutable storage, still allocated only once
+                glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAX_LEVEL, levels - 1)
+                glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA8, w, h, 0, GL_BGRA, GL_UNSIGNED_INT_8_8_8_8_REV, None)
+            self._texture_size = (w, h)
+        # Rows are tightly packed 4-byte pixels
+        glPixelStorei(GL_UNPACK_ALIGNMENT, 4)
         # Upload the texture data to GPU memory
-        glTexImage2D(
+        glTexSubImage2D(
             GL_TEXTURE_2D,  # Target: 2D texture
             0,              # Level of detail (0 = base)
-            GL_RGBA,        # Internal format (GPU storage format)
+            0, 0,           # x/y offset into the texture
             w, h,           # Width and height
-            0,              # Border (must be 0)
-            GL_RGBA,        # Format of the provided data
-            GL_UNSIGNED_BYTE, # Data type of the provided data
+            GL_BGRA,        # Format of the provided data
+            GL_UNSIGNED_INT_8_8_8_8_REV, # Data type of the provided data (packed 32-bit words)
             data            # The actual pixel data
         )
+        # Rebuild the smaller mip levels from the new base level
+        glGenerateMipmap(GL_TEXTURE_2D)
 
 
     def resizeGL(self, w, h):
-        # Define the portion of the window to use for rendering (entire window)
-        glViewport(0, 0, w, h)
-        # Switch to modifying the projection matrix
-        glMatrixMode(GL_PROJECTION)
+        # (QOpenGLWidget sets the viewport to the entire widget itself)
         # Reset the projection matrix to the identity
-        glLoadIdentity()
+        self._proj.setToIdentity()
         # Set up a perspective projection:
         # - 45° field of view
         # - Aspect ratio based on window width/height
         # - Near clipping plane: 1.0
         # - Far clipping plane: 500,000 (so we can see far orbits)
-        gluPerspective(45.0, w / float(h or 1), 1.0, 500000.0)
-        # Switch back to modifying the modelview matrix
-        glMatrixMode(GL_MODELVIEW)
+        self._proj.perspective(45.0, w / float(h or 1), 1.0, 500000.0)
 
 
     def wheelEvent(self, ev):
@@ -185,108 +301,129 @@ class EarthGLWidget(QtOpenGL.QGLWidget):
         self.update()
 
 
+    def start_animation(self, step_ms):
+        """Advance the marker by one sample every step_ms of wall-clock time, from now."""
+        self._step_ms = max(step_ms, 1e-3)
+        self._elapsed = QtCore.QElapsedTimer()
+        self._elapsed.start()
+        self.update()
+
+
+    def stop_animation(self):
+        self._elapsed = None
+        self._next_frame.stop()
+
+
+    def _on_frame_swapped(self):
+        if self._elapsed is None:
+            return
+        # Next frame once the marker reaches its next sample; when samples are shorter than
+        # a frame just request it now and let the vsync-blocked swap pace the loop
+        wait_ms = self._step_ms - self._elapsed.elapsed() % self._step_ms
+        if wait_ms > 16:
+            self._next_frame.start(int(wait_ms))
+        else:
+            self.update()
+
+
     def paintGL(self):
+        # While animating, the marker position follows real elapsed time (no timer drift,
+        # repaints that come late simply skip ahead)
+        if self._elapsed is not None and len(self.satellite_positions):
+            self.marker_index = int(self._elapsed.elapsed() / self._step_ms) % len(self.satellite_positions)
         # Clear the color and depth buffers so we start fresh each frame
+        glClearColor(*self.bgcolor)
         glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
-        # Reset the current modelview matrix to the identity (no transformation)
-        glLoadIdentity()
         # Calculate how far the virtual camera should be from the Earth
         # 18000 is a base distance in km; self.zoom changes this distance
         cam_dist = 18000 * self.zoom
         # Position and aim the camera:
-        # gluLookAt(eye_x, eye_y, eye_z,  center_x, center_y, center_z,  up_x, up_y, up_z)
+        # lookAt(eye, center, up)
         # Here: camera is at (0,0,cam_dist), looking at the origin (Earth's center),
         # with the 'up' direction being the +Y axis
-        gluLookAt(0, 0, cam_dist,
-                0, 0, 0,
-                0, 1, 0)
+        view = QtGui.QMatrix4x4()
+        view.lookAt(QtGui.QVector3D(0, 0, cam_dist),
+                    QtGui.QVector3D(0, 0, 0),
+                    QtGui.QVector3D(0, 1, 0))
         # Apply mouse-controlled rotation around the X axis (tilt up/down)
-        glRotatef(self.rot_x, 1, 0, 0)
+        view.rotate(self.rot_x, 1, 0, 0)
         # Apply mouse-controlled rotation around the Z axis (spin around the vertical axis)
         # This replaces the usual Y-axis rotation for a globe, to match your intended behavior
-        glRotatef(self.rot_y, 0, 0, 1)
+        view.rotate(self.rot_y, 0, 0, 1)
         # Apply Earth's axial tilt (23.44 degrees) around the Y axis
         # This tilts the planet so the poles are angled correctly relative to the orbit plane
-        glRotatef(23.44, 0, 1, 0)
+        view.rotate(23.44, 0, 1, 0)
+        self._view = view
+        # The fixed-function path and marker use the same matrices (column-major data())
+        glMatrixMode(GL_PROJECTION)
+        glLoadMatrixf(self._proj.data())
+        glMatrixMode(GL_MODELVIEW)
+        glLoadMatrixf(view.data())
 
-        # Draw the textured sphere representing Earth, with radius = 6371 km
-        self.draw_textured_earth(radius=6371.0)
+        # Draw the textured sphere representing Earth, with radius = 6371 km, tessellated for the zoom
+        stacks, slices = next(lod for zmin, lod in _EARTH_LODS if self.zoom > zmin)
+        self.draw_textured_earth(radius=6371.0, stacks=stacks, slices=slices)
         # Draw path (only if we actually have satellite position data)
         if self.satellite_positions.size:
             # Short alias for positions array (ECEF coordinates in km)
             pts = self.satellite_positions
-            # Set the line width for the orbital path
-            glLineWidth(2.0)
-            # Begin drawing a continuous line strip (connects each vertex in sequence)
-            glBegin(GL_LINE_STRIP)
-            # Set the current drawing color for the path
-            glColor3f(*self.line_color)
             # If show_accum is True, draw the entire accumulated path of the satellite
+            # (otherwise only the marker: a one-vertex line strip draws nothing)
             if self.show_accum:
-                for p in pts:
-                    # Plot each point in 3D space (x, y, z in km)
-                    glVertex3f(p[0], p[1], p[2])
-            else:
-                # Otherwise, only draw the current marker position (single vertex)
-                idx = max(0, min(self.marker_index, len(pts)-1))
-                glVertex3f(*pts[idx])
-            # End the line strip drawing
-            glEnd()
+                if self._path_vbo is None:
+                    self._upload_path()
+                # Set the line width and color for the orbital path
+                glLineWidth(2.0)
+                glColor3f(*self.line_color)
+                # One continuous line strip straight from the VBO (x, y, z in km)
+                glBindBuffer(GL_ARRAY_BUFFER, self._path_vbo)
+                glEnableClientState(GL_VERTEX_ARRAY)
+                glVertexPointer(3, GL_FLOAT, 0, None)
+                glDrawArrays(GL_LINE_STRIP, 0, len(self._path_f32))
+                glDisableClientState(GL_VERTEX_ARRAY)
+                glBindBuffer(GL_ARRAY_BUFFER, 0)
             # Draw the satellite marker at the current index position
             idx = max(0, min(self.marker_index, len(pts)-1))
             self.draw_satellite_marker(pts[idx])
-            # Draw satellite marker
-            idx = max(0, min(self.marker_index, len(pts)-1))
-            self.draw_satellite_marker(pts[idx])
 
 
     def draw_textured_earth(self, radius=6371.0, stacks=40, slices=80):
-        # Enable 2D texturing so that vertices can be mapped to texture coordinates
-        glEnable(GL_TEXTURE_2D)
-        # If we have already loaded a texture, bind it so OpenGL uses it for drawing
+        # If we have already loaded a texture, bind it to unit 0 (uEarthTex) for the shader
         if self.texture_id is not None:
+            glActiveTexture(GL_TEXTURE0)
             glBindTexture(GL_TEXTURE_2D, self.texture_id)
-        # Save current transformation matrix so we can restore after tilt
-        glPushMatrix()
+        # The sphere lives in a VBO/IBO pair, uploaded the first time this tessellation is drawn
+        key = (radius, stacks, slices)
+        if key not in self._earth_meshes:
+            verts, indices = build_earth_mesh(radius, stacks, slices)
+            vbo, ibo = glGenBuffers(2)
+            glBindBuffer(GL_ARRAY_BUFFER, vbo)
+            glBufferData(GL_ARRAY_BUFFER, verts.nbytes, verts, GL_STATIC_DRAW)
+            glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, ibo)
+            glBufferData(GL_ELEMENT_ARRAY_BUFFER, indices.nbytes, indices, GL_STATIC_DRAW)
+            self._earth_meshes[key] = (vbo, ibo, indices.size)
+        vbo, ibo, count = self._earth_meshes[key]
         # Apply an axial tilt to match Earth's obliquity so that the texture lines up correctly
-        glRotatef(180, 0, 0, 1)
-        glRotatef(-OBLIQUITY_DEG, 1, 0, 0)
-        # Loop through horizontal bands of the sphere (latitude)
-        for i in range(stacks):
-            # lat0 and lat1 are the start and end latitudes of the current band
-            lat0 = math.pi * (-0.5 + i / stacks)
-            lat1 = math.pi * (-0.5 + (i+1) / stacks)
-            # y0, y1 are the vertical positions (sin of latitude)
-            y0 = math.sin(lat0)
-            y1 = math.sin(lat1)
-            # r0, r1 are the radius of the horizontal cross section at each latitude
-            r0 = math.cos(lat0)
-            r1 = math.cos(lat1)
-            # Start defining a horizontal strip (quad strip) for the current latitude band
-            glBegin(GL_QUAD_STRIP)
-            for j in range(slices+1):  # slices+1 so the strip closes fully
-                # Compute longitude for this slice
-                lon = 2 * math.pi * (j / slices)
-                # x0, z0 are the horizontal positions on the sphere's surface
-                x0 = math.cos(lon)
-                z0 = math.sin(lon)
-                # Map 3D longitude/latitude to 2D texture coordinates
-                u = j / slices
-                v0 = 0.5 + lat0 / math.pi
-                v1 = 0.5 + lat1 / math.pi
-                # First vertex of the quad strip segment
-                glTexCoord2f(u, v0)         # texture coordinates (u, v)
-                glNormal3f(r0*x0, r0*z0, y0) # normal vector for lighting
-                glVertex3f(radius*r0*x0, radius*r0*z0, radius*y0)  # position
-                # Second vertex of the quad strip segment
-                glTexCoord2f(u, v1)
-                glNormal3f(r1*x0, r1*z0, y1)
-                glVertex3f(radius*r1*x0, radius*r1*z0, radius*y1)
-            glEnd()
-        # Restore the transformation matrix (removes tilt for the rest of the scene)
-        glPopMatrix()
-        # Disable texturing after drawing
-        glDisable(GL_TEXTURE_2D)
+        # (on a copy of the camera matrix, so the rest of the scene is unaffected)
+        model_view = QtGui.QMatrix4x4(self._view)
+        model_view.rotate(180, 0, 0, 1)
+        model_view.rotate(-OBLIQUITY_DEG, 1, 0, 0)
+        prog = self._earth_program
+        prog.bind()
+        prog.setUniformValue("uMVP", self._proj * model_view)
+        prog.setUniformValue("uNormalMatrix", model_view.normalMatrix())
+        # Interleaved (x, y, z, nx, ny, nz, u, v) float32 -> 32 byte stride
+        glBindBuffer(GL_ARRAY_BUFFER, vbo)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, ibo)
+        for location, (size, offset) in enumerate(((3, 0), (3, 12), (2, 24))):
+            glEnableVertexAttribArray(location)
+            glVertexAttribPointer(location, size, GL_FLOAT, GL_FALSE, 32, ctypes.c_void_p(offset))
+        glDrawElements(GL_TRIANGLE_STRIP, count, GL_UNSIGNED_INT, None)
+        for location in range(3):
+            glDisableVertexAttribArray(location)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        prog.release()
 
 
     def draw_satellite_marker(self, pos_km, scale=1.0):
@@ -294,36 +431,52 @@ class EarthGLWidget(QtOpenGL.QGLWidget):
         Draw a small sphere (silver) at pos_km (km) and simple solar panels (navy-blue).
         pos_km: [x,y,z] in km ECEF
         """
+        if self._marker_mesh is None:
+            # 50 km sphere (visual scale, adjust if too large), low-poly: it covers a few pixels
+            verts, indices = build_earth_mesh(50.0, 16, 16)
+            body_vbo, body_ibo, panel_vbo = glGenBuffers(3)
+            glBindBuffer(GL_ARRAY_BUFFER, body_vbo)
+            glBufferData(GL_ARRAY_BUFFER, verts.nbytes, verts, GL_STATIC_DRAW)
+            glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, body_ibo)
+            glBufferData(GL_ELEMENT_ARRAY_BUFFER, indices.nbytes, indices, GL_STATIC_DRAW)
+            glBindBuffer(GL_ARRAY_BUFFER, panel_vbo)
+            glBufferData(GL_ARRAY_BUFFER, _MARKER_PANELS.nbytes, _MARKER_PANELS, GL_STATIC_DRAW)
+            self._marker_mesh = (body_vbo, body_ibo, indices.size, panel_vbo)
+        body_vbo, body_ibo, count, panel_vbo = self._marker_mesh
         glPushMatrix()
         glTranslatef(pos_km[0], pos_km[1], pos_km[2])
-        # satellite body
+        glEnableClientState(GL_VERTEX_ARRAY)
+        # satellite body (same interleaved layout as the Earth mesh; uvs unused)
         glColor3f(0.75, 0.75, 0.75)  # silver
-        quad = gluNewQuadric()
-        gluSphere(quad, 50.0, 20, 20)  # 50 km visual scale (adjust if too large)
-        gluDeleteQuadric(quad)
-        # solar panels (two rectangles)
+        glBindBuffer(GL_ARRAY_BUFFER, body_vbo)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, body_ibo)
+        glEnableClientState(GL_NORMAL_ARRAY)
+        glVertexPointer(3, GL_FLOAT, 32, ctypes.c_void_p(0))
+        glNormalPointer(GL_FLOAT, 32, ctypes.c_void_p(12))
+        glDrawElements(GL_TRIANGLE_STRIP, count, GL_UNSIGNED_INT, None)
+        glDisableClientState(GL_NORMAL_ARRAY)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+        # solar panels (two rectangles), flat navy: unlit, so glColor is the final color
         glDisable(GL_LIGHTING)
         glColor3f(0.0, 0.0, 0.5)
-        # draw your panel
+        glBindBuffer(GL_ARRAY_BUFFER, panel_vbo)
+        glVertexPointer(3, GL_FLOAT, 0, None)
+        glDrawArrays(GL_QUADS, 0, len(_MARKER_PANELS))
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
         glEnable(GL_LIGHTING)
-        glBegin(GL_QUADS)
-        # left panel
-        glVertex3f(-144.0, -10.0, 10.0)
-        glVertex3f(-144.0,  10.0, 10.0)
-        glVertex3f(-60.0,   10.0, 10.0)
-        glVertex3f(-60.0,  -10.0, 10.0)
-        # right panel
-        glVertex3f(60.0, -10.0, 10.0)
-        glVertex3f(60.0,  10.0, 10.0)
-        glVertex3f(144.0,  10.0, 10.0)
-        glVertex3f(144.0, -10.0, 10.0)
-        glEnd()
+        glDisableClientState(GL_VERTEX_ARRAY)
         glPopMatrix()
 
 
     def set_positions_ecef(self, positions_km, show_accum=True, marker_index=0, lncolor=(1,0,0)):
         # Store the satellite positions in ECEF coordinates (convert to numpy array for performance)
         self.satellite_positions = np.array(positions_km, dtype=float)
+        # The path is drawn from a VBO: upload it now if the context exists, else on first paint
+        self._path_f32 = np.ascontiguousarray(self.satellite_positions, dtype=np.float32)
+        if self.isValid():
+            self.makeCurrent()
+            self._upload_path()
+            self.doneCurrent()
         # Whether to show the entire accumulated path or only the marker
         self.show_accum = show_accum
         # The index of the "current" marker along the path
@@ -334,13 +487,22 @@ class EarthGLWidget(QtOpenGL.QGLWidget):
         self.update()
 
 
+    def _upload_path(self):
+        """Copy _path_f32 into the path VBO (created on first use); needs a current context."""
+        if self._path_vbo is None:
+            self._path_vbo = glGenBuffers(1)
+        glBindBuffer(GL_ARRAY_BUFFER, self._path_vbo)
+        glBufferData(GL_ARRAY_BUFFER, self._path_f32.nbytes, self._path_f32, GL_STATIC_DRAW)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+
+
     def set_bgcolor(self, hexcolor):
         # Convert the hex color (e.g. "#000000") into a QColor object
         c = QtGui.QColor(hexcolor)
         # Store the background color as a tuple of floats (0–1 range)
         self.bgcolor = (c.redF(), c.greenF(), c.blueF(), c.alphaF())
-        # Immediately tell OpenGL to use this as the clear color
-        glClearColor(*self.bgcolor)
+        # paintGL sets it as the clear color (there is no current GL context here)
+        self.update()
 
 
 
@@ -348,15 +510,26 @@ class OrbitPlot(QtWidgets.QWidget):
     """
     Main class to be embedded.
     Constructor: OrbitPlot(elems_array, parent=None, earth_texture='earth.jpg')
+    elems_array is one [a_km, e, i_deg, raan_deg, argp_deg, M0_deg, epoch] row, or a
+    (1, 7) table as built by np.column_stack(tle_to_kepler6_batch(...)). Only one
+    satellite is plotted, so a table with more rows raises ValueError.
     """
     def __init__(self, elems, parent=None, earth_texture='earth.jpg'):
         super().__init__(parent)
+        if np.ndim(elems) == 2:
+            if len(elems) != 1:
+                raise ValueError(f"OrbitPlot plots a single satellite, got {len(elems)} element rows")
+            elems = np.asarray(elems)[0]
         self.elems = elems
         self.earth_texture = earth_texture
         self.layout = QtWidgets.QVBoxLayout(self)
         self.setLayout(self.layout)
         # Two subwidgets (we will add/replace depending on which method is called)
         self.gl_widget = EarthGLWidget(self, earth_texture_path=self.earth_texture)
+        # GPU line rasterization for the 2D plots; must be set before the PlotWidget exists.
+        # segmentedLineMode draws the live track's wide-pen "pairs" curves as one batch of
+        # independent segments instead of stroking a path (pyqtgraph >= 0.13.1)
+        pg.setConfigOptions(useOpenGL=True, antialias=False, segmentedLineMode='on')
         self.pg_plot = pg.PlotWidget()
         self.pg_plot.setAspectLocked(False)
         self.animation_timer = None
@@ -364,7 +537,35 @@ class OrbitPlot(QtWidgets.QWidget):
         self._cached_times = None
         self._cached_r_eci = None
         self._cached_r_ecef = None
+        # ((N, total_time), (times, r_eci, r_ecef)) for the most recent plot, reused when it
+        # is restarted; positions are stored column-major so x, y and z are each one contiguous run
+        self._buf_cache = None
         self._epoch = elems[-1]
+        # decoded background map, shared by _2d and liveorbit across restarts
+        self._bg_cache = None
+        # True -> solve Kepler by table lookup (propagate_orbit_lut) in _3d/_2d/liveorbit,
+        # accurate enough for display
+        self.kepler_lut = False
+        # everything a liveorbit tick needs, built once per liveorbit call (see _live_tick)
+        self._live_state = None
+        # set while a live tick runs; a timeout arriving meanwhile is dropped, not queued
+        self._live_busy = False
+        # wall-clock time of the last drawn live frame
+        self._live_last_now = -math.inf
+        # JIT-compile the Numba kernels now rather than in the first animation frame
+        _warmup_kernels()
+
+
+    def _background_array(self, img_path):
+        """
+        Background map as a row-major RGBA array, decoded once and cached.
+        The old rotate(90) + FLIP_LEFT_RIGHT + FLIP_TOP_BOTTOM chain (read col-major) is the
+        same picture as the image flipped vertically and read row-major: one copy, no rotations.
+        """
+        if self._bg_cache is None:
+            arr = np.asarray(Image.open(img_path).convert("RGBA"))
+            self._bg_cache = np.ascontiguousarray(arr[::-1])
+        return self._bg_cache
 
 
     def _prepare_propagation(self, animation=True, revolves=None, sample_points_per_orbit=2000, orbit_time_scale=1.0):
@@ -379,17 +580,26 @@ class OrbitPlot(QtWidgets.QWidget):
             self.animation_timer.stop()
             self.animation_timer.deleteLater()
             self.animation_timer = None
+        self.gl_widget.stop_animation()
         if not animation and revolves is not None:
             total_time = T * revolves
             N = max(300, int(sample_points_per_orbit * revolves))
-            times = np.linspace(0, total_time, N)
         else:
             # Animation mode: generate multiple orbits if needed, but keep sample rate per orbit fixed
             total_time = T * (revolves if revolves is not None else 2.0)
             N = int(sample_points_per_orbit * (revolves if revolves is not None else 2.0))
-            times = np.linspace(0, total_time, N)
-        r_eci = propagate_orbit(self.elems, times)
-        r_ecef = eci_to_ecef(r_eci, times)
+        # The time grid depends only on (N, total_time); it and the position buffers are kept
+        # for the last key only and reused when the same plot is restarted
+        key = (N, total_time)
+        if self._buf_cache is None or self._buf_cache[0] != key:
+            self._buf_cache = (key, (np.linspace(0, total_time, N),
+                                     np.empty((N, 3), order='F'), np.empty((N, 3), order='F')))
+        times, r_eci, r_ecef = self._buf_cache[1]
+        # propagate_orbit runs the fused Numba kernel when numba is installed (orbit_pyqtgraph[fast]),
+        # writing straight into the preallocated (N x 3) buffers
+        propagate = propagate_orbit_lut if self.kepler_lut else propagate_orbit
+        propagate(self.elems, times, out=r_eci)
+        eci_to_ecef(r_eci, times, out=r_ecef)
         self._cached_times = times
         self._cached_r_eci = r_eci
         self._cached_r_ecef = r_ecef
@@ -415,30 +625,23 @@ class OrbitPlot(QtWidgets.QWidget):
         times, r_eci, r_ecef, period = self._prepare_propagation(animation=animation, revolves=revolves)
         # set widget colors/background
         self.gl_widget.set_bgcolor(bgcolor)
-        rgb = tuple(int(lncolor.lstrip('#')[i:i+2], 16)/255.0 for i in (0,2,4))
+        rgb = _hex_rgb(lncolor)
         self.gl_widget.line_color = rgb
         self.gl_widget.show_accum = accumulation
         self.gl_widget.revolves = revolves
         # update positions (in ECEF) into GL widget
         self.gl_widget.set_positions_ecef(r_ecef, show_accum=accumulation, marker_index=0, lncolor=rgb)
         if animation:
-            if self.animation_timer:
-                self.animation_timer.stop()
-                self.animation_timer.deleteLater()
-            self.animation_timer = QtCore.QTimer(self)
             N = len(times)
             orbits_to_show = revolves if revolves else 2
             points_per_orbit = max(1, N // orbits_to_show)
-            interval_ms = max(1, int((period / points_per_orbit) * 1000))
-            index = {'i': 0}
-            def update_frame():
-                index['i'] = (index['i'] + 1) % N
-                self.gl_widget.marker_index = index['i']
-                self.gl_widget.update()
-            self.animation_timer.timeout.connect(update_frame)
-            self.animation_timer.start(interval_ms)
+            step_ms = (period / points_per_orbit) * 1000
+            # the widget picks the marker from its own clock and re-arms its repaint on
+            # frameSwapped, so paints never queue up behind a timer
+            self.gl_widget.start_animation(step_ms)
         else:
             # static: set marker to last index
+            self.gl_widget.stop_animation()
             self.gl_widget.marker_index = len(times)-1
             self.gl_widget.update()
 
@@ -466,13 +669,7 @@ class OrbitPlot(QtWidgets.QWidget):
         img_path = os.path.join(os.path.dirname(__file__), self.earth_texture)
         if os.path.exists(img_path):
             try:
-                pil_img = Image.open(img_path).convert("RGBA")
-                # Correct orientation
-                pil_img = pil_img.rotate(90, expand=True)
-                pil_img = pil_img.transpose(Image.FLIP_LEFT_RIGHT)
-                pil_img = pil_img.transpose(Image.FLIP_TOP_BOTTOM)
-                bgarr = np.array(pil_img)
-                bgitem = pg.ImageItem(bgarr)
+                bgitem = pg.ImageItem(self._background_array(img_path), axisOrder='row-major')
                 bgitem.setRect(QtCore.QRectF(-180, -90, 360, 180))
                 self.pg_plot.addItem(bgitem)
                 self.pg_plot.setLimits(xMin=-180, xMax=180, yMin=-90, yMax=90)
@@ -480,29 +677,24 @@ class OrbitPlot(QtWidgets.QWidget):
             except Exception as e:
                 print(f"Error loading image {img_path}: {e}")
         # ---- Prepare pen ----
-        rgb = tuple(int(lncolor.lstrip('#')[i:i+2], 16)/255.0 for i in (0, 2, 4))
-        pen = pg.mkPen(color=tuple([int(255*c) for c in rgb]), width=2)
-        # ---- Function to avoid horizontal line at dateline ----
-        def add_wrapped_segments(plot_widget, lon_arr, lat_arr):
-            if len(lon_arr) < 2:
-                return []
-            segments = []
-            seg_lon = [lon_arr[0]]
-            seg_lat = [lat_arr[0]]
-            for i in range(1, len(lon_arr)):
-                if abs(lon_arr[i] - lon_arr[i-1]) > 180:
-                    seg = pg.PlotCurveItem(seg_lon, seg_lat, pen=pen)
-                    plot_widget.addItem(seg)
-                    segments.append(seg)
-                    seg_lon = [lon_arr[i]]
-                    seg_lat = [lat_arr[i]]
-                else:
-                    seg_lon.append(lon_arr[i])
-                    seg_lat.append(lat_arr[i])
-            seg = pg.PlotCurveItem(seg_lon, seg_lat, pen=pen)
-            plot_widget.addItem(seg)
-            segments.append(seg)
-            return segments
+        rgb = _hex_rgb(lncolor)
+        pen = pg.mkPen(color=tuple(round(255*c) for c in rgb), width=2)
+        # ---- Avoid horizontal line at dateline ----
+        # NaN after every dateline jump (with connect="finite" the curve is broken there),
+        # built once for the whole track; frames only slice it
+        breaks = np.where(np.abs(np.diff(lon)) > 180)[0] + 1
+        lon_plot = np.insert(lon, breaks, np.nan)
+        lat_plot = np.insert(lat, breaks, np.nan)
+        # sample i sits after every NaN inserted at or before it
+        samples = np.arange(len(lon))
+        index_map = samples + np.searchsorted(breaks, samples, side='right')
+        # ---- One track curve, created once and updated in place ----
+        # Longitude wraps at the dateline and has NaN breaks, so it is not increasing:
+        # pyqtgraph's clip-to-view (searchsorted on x) and auto-downsampling (step from the
+        # x span) would drop whole passes, and both stay off
+        track = self.pg_plot.plot(pen=pen, connect="finite")
+        track.setClipToView(False)
+        track.setDownsampling(auto=False)
         # ---- Marker for current position ----
         marker = pg.ScatterPlotItem([lon[0]], [lat[0]], size=10, brush=pg.mkBrush(200, 200, 200))
         self.pg_plot.addItem(marker)
@@ -516,20 +708,16 @@ class OrbitPlot(QtWidgets.QWidget):
                 self.animation_timer.stop()
                 self.animation_timer.deleteLater()
             self.animation_timer = QtCore.QTimer(self)
+            # intervals are a few ms; a coarse timer would beat against them and stutter
+            self.animation_timer.setTimerType(QtCore.Qt.PreciseTimer)
             index = {'i': 0}
-            current_segments = []
 
             def update2d():
-                nonlocal current_segments
                 index['i'] = (index['i'] + 1) % N
-                # Remove old track segments
-                for seg in current_segments:
-                    self.pg_plot.removeItem(seg)
-                current_segments.clear()
+                # Only the accumulated track is drawn; a single point makes no line
                 if accumulation:
-                    current_segments = add_wrapped_segments(self.pg_plot, lon[:index['i']+1], lat[:index['i']+1])
-                else:
-                    current_segments = add_wrapped_segments(self.pg_plot, [lon[index['i']]], [lat[index['i']]])
+                    k = index_map[index['i']] + 1
+                    track.setData(lon_plot[:k], lat_plot[:k])
                 # Move marker
                 marker.setData([lon[index['i']]], [lat[index['i']]])
 
@@ -538,17 +726,16 @@ class OrbitPlot(QtWidgets.QWidget):
         else:
             # Static mode
             if accumulation:
-                add_wrapped_segments(self.pg_plot, lon, lat)
-            else:
-                add_wrapped_segments(self.pg_plot, [lon[-1]], [lat[-1]])
+                track.setData(lon_plot, lat_plot)
             marker.setData([lon[-1]], [lat[-1]])
 
 
-    def liveorbit(self, lncolor='#ff0000', epoch_time=None):
+    def liveorbit(self, lncolor='#ff0000', epoch_time=None, throttle_hz=None):
         """
         Live ground track: 1 revolution total around 'now', satellite centered,
         ends fade to transparent, moves in sync with actual orbital motion.
         This version aligns Earth orientation with GMST at epoch (GPredict-style).
+        throttle_hz caps the update rate (default: the primary screen's refresh rate).
         """
         # --- Resolve epoch timestamp (float seconds since UNIX epoch) ---
         if epoch_time is not None:
@@ -558,31 +745,7 @@ class OrbitPlot(QtWidgets.QWidget):
             epoch_ts = float(self._epoch) if isinstance(self._epoch, (int, float)) \
                     else datetime.datetime.fromisoformat(self._epoch).timestamp()
         # --- GMST at epoch (radians) ---
-        def gmst_rad(unix_ts: float) -> float:
-            # Convert UNIX -> UTC datetime
-            dt = datetime.datetime.utcfromtimestamp(unix_ts)
-            # Julian Date
-            Y, M, D = dt.year, dt.month, dt.day
-            h, m, s = dt.hour, dt.minute, dt.second + dt.microsecond*1e-6
-            if M <= 2:
-                Y -= 1
-                M += 12
-            A = math.floor(Y/100)
-            B = 2 - A + math.floor(A/4)
-            JD0 = math.floor(365.25*(Y + 4716)) + math.floor(30.6001*(M + 1)) + D + B - 1524.5
-            frac_day = (h + (m + s/60.0)/60.0)/24.0
-            JD = JD0 + frac_day
-            T = (JD - 2451545.0)/36525.0  # centuries since J2000.0
-
-            # IAU 1982 expression for GMST in seconds of time
-            GMST_sec = (67310.54841
-                        + (876600.0*3600 + 8640184.812866)*T
-                        + 0.093104*(T**2)
-                        - 6.2e-6*(T**3))
-            # Convert to radians in [0, 2π)
-            GMST_deg = (GMST_sec/240.0) % 360.0
-            return math.radians(GMST_deg)
-        gst0 = gmst_rad(epoch_ts)
+        gst0 = float(gmst_rad(epoch_ts))
         # --- Clear layout and set plot ---
         for i in reversed(range(self.layout.count())):
             w = self.layout.itemAt(i).widget()
@@ -597,12 +760,7 @@ class OrbitPlot(QtWidgets.QWidget):
         img_path = os.path.join(os.path.dirname(__file__), self.earth_texture)
         if os.path.exists(img_path):
             try:
-                pil_img = Image.open(img_path).convert("RGBA")
-                pil_img = pil_img.rotate(90, expand=True)
-                pil_img = pil_img.transpose(Image.FLIP_LEFT_RIGHT)
-                pil_img = pil_img.transpose(Image.FLIP_TOP_BOTTOM)
-                bgarr = np.array(pil_img)
-                bgitem = pg.ImageItem(bgarr)
+                bgitem = pg.ImageItem(self._background_array(img_path), axisOrder='row-major')
                 bgitem.setRect(QtCore.QRectF(-180, -90, 360, 180))
                 self.pg_plot.addItem(bgitem)
                 self.pg_plot.setLimits(xMin=-180, xMax=180, yMin=-90, yMax=90)
@@ -617,64 +775,99 @@ class OrbitPlot(QtWidgets.QWidget):
         if self.animation_timer:
             self.animation_timer.stop()
             self.animation_timer.deleteLater()
+        self.gl_widget.stop_animation()
         self.animation_timer = QtCore.QTimer(self)
+        self.animation_timer.setTimerType(QtCore.Qt.PreciseTimer)
         # --- Parameters ---
         sample_points = 2000
         half_window_time = period / 2
-        base_rgb = tuple(int(lncolor.lstrip('#')[k:k+2], 16) for k in (0, 2, 4))
-        current_segments = []
-
-        def add_wrapped_gradient(plot_widget, lon_seg, lat_seg, base_rgb):
-            if len(lon_seg) < 2:
-                return []
-            # split on dateline
-            segs, seg_lon, seg_lat = [], [lon_seg[0]], [lat_seg[0]]
-            for j in range(1, len(lon_seg)):
-                if abs(lon_seg[j] - lon_seg[j-1]) > 180:
-                    segs.append((seg_lon, seg_lat))
-                    seg_lon, seg_lat = [lon_seg[j]], [lat_seg[j]]
-                else:
-                    seg_lon.append(lon_seg[j]); seg_lat.append(lat_seg[j])
-            segs.append((seg_lon, seg_lat))
-            N = len(lon_seg); half = N // 2
-            alpha_profile = np.concatenate([
-                np.linspace(0, 255, half, endpoint=False),
-                np.linspace(255, 0, N - half, endpoint=True)])
-            items, start_idx = [], 0
-            for seg_lon, seg_lat in segs:
-                seg_len = len(seg_lon)
-                alphas = alpha_profile[start_idx:start_idx + seg_len]
-                start_idx += seg_len
-                for k in range(seg_len - 1):
-                    pen = pg.mkPen(color=(base_rgb[0], base_rgb[1], base_rgb[2], int(alphas[k])), width=2)
-                    seg_item = pg.PlotCurveItem([seg_lon[k], seg_lon[k+1]], [seg_lat[k], seg_lat[k+1]], pen=pen)
-                    seg_item.setZValue(100)
-                    plot_widget.addItem(seg_item)
-                    items.append(seg_item)
-            return items
-
-        def update_live():
-            nonlocal current_segments
-            for seg in current_segments:
-                self.pg_plot.removeItem(seg)
-            current_segments.clear()
-            now = time.time()
-            # Centered time window and RELATIVE time since epoch for propagation/rotation
-            times_abs = np.linspace(-half_window_time, half_window_time, sample_points) + now
-            t_rel = times_abs - epoch_ts  # seconds since epoch
-            # Propagate with relative time (epoch is when M0 is defined)
-            r_eci = propagate_orbit(self.elems, t_rel)  # M0_epoch_time=0 by design with t_rel
-            # Rotate Earth using GMST(epoch) + omega * (t - epoch)
-            r_ecef = eci_to_ecef(r_eci, t_rel, gst0=gst0)
-            # Convert to lat/lon
-            lat, lon, _ = ecef_to_latlon(r_ecef)
-            # Normalize lon to [-180,180] for plotting
-            lon = ((lon + 180) % 360) - 180
-            current_segments = add_wrapped_gradient(self.pg_plot, lon, lat, base_rgb)
-            # Marker at actual "now"
-            idx_now = np.argmin(np.abs(times_abs - now))
-            marker.setData([lon[idx_now]], [lat[idx_now]])
-
+        base_rgb = tuple(round(255*c) for c in _hex_rgb(lncolor))
+        # the window offsets around "now" never change; only now itself moves each tick
+        dt_offsets = np.linspace(-half_window_time, half_window_time, sample_points)
+        # the window is centered on now, so "now" is always the middle sample
+        idx_now = sample_points // 2
+        # scratch arrays (rotation angle, cos/sin) and every per-tick result, allocated once.
+        # Positions and lat/lon are only drawn, so they are kept in float32 (~1 m at
+        # orbital radii); t_rel stays float64 since it feeds the mean anomaly
+        live_ws = {}
+        live_dtype = np.float32
+        t_rel = np.empty(sample_points)
+        lat_buf = np.empty(sample_points, dtype=live_dtype); lon_buf = np.empty(sample_points, dtype=live_dtype)
+        alt_buf = np.empty(sample_points, dtype=live_dtype)
+        r_eci_buf = np.empty((sample_points, 3), dtype=live_dtype, order='F')
+        r_ecef_buf = np.empty((sample_points, 3), dtype=live_dtype, order='F')
+        # the fading track is drawn as one curve per alpha step instead of one per edge
+        alpha_levels = 32
+        # the fade depends only on the sample position in the window, so each edge's alpha
+        # step is fixed: edge k joins samples k and k+1
+        half = sample_points // 2
+        alpha_profile = np.concatenate([
+            np.linspace(0, 255, half, endpoint=False),
+            np.linspace(255, 0, sample_points - half, endpoint=True)])
+        level = np.rint(alpha_profile[:-1] * ((alpha_levels - 1) / 255.0)).astype(int)
+        # one persistent curve (and pen) per alpha step, refilled with setData every tick
+        gradient_pool = []
+        for b in np.unique(level):
+            alpha = int(round(b * 255.0 / (alpha_levels - 1)))
+            pen = pg.mkPen(color=(base_rgb[0], base_rgb[1], base_rgb[2], alpha), width=2)
+            seg_item = pg.PlotCurveItem(pen=pen, connect="pairs", skipFiniteCheck=True)
+            seg_item.setZValue(100)
+            self.pg_plot.addItem(seg_item)
+            gradient_pool.append((np.flatnonzero(level == b), seg_item))
+        # a tick less than half a sample spacing after the last one would redraw the same track
+        min_step = 0.5 * period / sample_points
+        self._live_last_now = -math.inf
+        self._live_state = (dt_offsets, epoch_ts, gst0, idx_now, min_step, live_dtype, live_ws, t_rel,
+                            lat_buf, lon_buf, alt_buf, r_eci_buf, r_ecef_buf, gradient_pool, marker)
         interval_ms = max(1, int((period / sample_points) * 1000))
-        self.animation_timer.timeout.connect(update_live)
+        # each tick recomputes the track from the clock, so ticks faster than the display
+        # refreshes are never seen; cap the rate there
+        if throttle_hz is None:
+            screen = QtWidgets.QApplication.primaryScreen()
+            throttle_hz = screen.refreshRate() if screen is not None else 60.0
+        if throttle_hz > 0:
+            interval_ms = max(interval_ms, int(1000.0 / throttle_hz))
+        self.animation_timer.timeout.connect(self._live_tick)
         self.animation_timer.start(interval_ms)
+
+
+    def _live_tick(self):
+        """One liveorbit frame: recompute the window around now and refill the curves."""
+        if self._live_busy:
+            return
+        self._live_busy = True
+        try:
+            self._live_frame()
+        finally:
+            self._live_busy = False
+
+
+    def _live_frame(self):
+        (dt_offsets, epoch_ts, gst0, idx_now, min_step, live_dtype, live_ws, t_rel,
+         lat_buf, lon_buf, alt_buf, r_eci_buf, r_ecef_buf, gradient_pool, marker) = self._live_state
+        now = time.time()
+        if now - self._live_last_now < min_step:
+            return
+        self._live_last_now = now
+        # Centered time window and RELATIVE time since epoch for propagation/rotation
+        np.add(dt_offsets, now - epoch_ts, out=t_rel)  # seconds since epoch
+        # Propagate with relative time (epoch is when M0 is defined, M0_epoch_time=0),
+        # rotate Earth using GMST(epoch) + omega * (t - epoch) and convert to lat/lon
+        if self.kepler_lut:
+            r_eci = propagate_orbit_lut(self.elems, t_rel, out=r_eci_buf)
+            r_ecef = eci_to_ecef(r_eci, t_rel, gst0=gst0, dtype=live_dtype, out=r_ecef_buf, workspace=live_ws)
+            lat, lon, _ = ecef_to_latlon(r_ecef, dtype=live_dtype, out=(lat_buf, lon_buf, alt_buf))
+        else:
+            lat, lon = propagate_latlon(self.elems, t_rel, gst0=gst0, dtype=live_dtype,
+                                        lat_out=lat_buf, lon_out=lon_buf)
+        # lon comes straight from atan2, so it is already in [-180, 180] for plotting.
+        # Edges jumping across the dateline are dropped
+        keep = np.abs(np.diff(lon)) <= 180
+        for edges, seg_item in gradient_pool:
+            k = edges[keep[edges]]
+            # (start, end) pairs of every edge at this alpha, drawn with connect="pairs"
+            x = np.column_stack((lon[k], lon[k+1])).ravel()
+            y = np.column_stack((lat[k], lat[k+1])).ravel()
+            seg_item.setData(x, y)
+        # Marker at actual "now"
+        marker.setData([lon[idx_now]], [lat[idx_now]])
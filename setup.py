@@ -34,6 +34,9 @@ setup(
     ],
     python_requires=">=3.7",
     install_requires=requirements,
+    extras_require={
+        "fast": ["numba>=0.56"],
+    },
     keywords="orbit, visualization, astronomy, satellite, pyqt5, opengl, pil",
      project_urls={
         "Source": "https://github.com/Islamtrabeih/orbit_pyqtgraph/tree/main",
@@ -0,0 +1,71 @@
+import datetime
+import math
+
+import numpy as np
+import pytest
+
+orb_math = pytest.importorskip("orbit_pyqtgraph.orb_math")
+
+ISS = ("1 25544U 98067A   25229.18034946  .00009619  00000-0  17645-3 0  9996",
+       "2 25544  51.6356   4.7550 0003499 229.5075 130.5609 15.49975761524621")
+MOLNIYA = ("1 24652U 96063A   25230.12195618  .00000257  00000-0  39011-4 0  9990",
+           "2 24652  63.7979 189.2201 7280347 270.0591  16.1348  2.00609021  1809")
+OLD_EPOCH = ("1 00005U 58002B   98123.50000000  .00000023  00000-0  28098-4 0  4753",
+             "2 00005  34.2682 348.7242 1859667 331.7664  19.3264 10.82419157413667")
+
+
+def slice_tle(line1, line2):
+    """Reference: the original per-field string slicing parser."""
+    epoch_str = line1[18:32].strip()
+    yy = int(epoch_str[:2])
+    year = 2000 + yy if yy < 57 else 1900 + yy
+    jan1 = datetime.datetime(year, 1, 1, tzinfo=datetime.timezone.utc)
+    epoch_time_s = (jan1 + datetime.timedelta(days=float(epoch_str[2:]) - 1.0)).timestamp()
+    n_rad_s = 2.0 * math.pi * float(line2[52:63]) / 86400.0
+    a_km = (orb_math.MU_EARTH ** (1.0/3.0)) / (n_rad_s ** (2.0/3.0))
+    return (a_km, float("0." + line2[26:33].strip()), float(line2[8:16]), float(line2[17:25]),
+            float(line2[34:42]), float(line2[43:51]), epoch_time_s)
+
+
+def test_batch_matches_slicing_parser():
+    tles = (ISS, MOLNIYA, OLD_EPOCH)
+    got = orb_math.tle_to_kepler6_batch([t[0] for t in tles], [t[1] for t in tles])
+    for row, (l1, l2) in enumerate(tles):
+        np.testing.assert_allclose([col[row] for col in got], slice_tle(l1, l2), rtol=1e-12, atol=1e-6)
+
+
+def test_scalar_matches_slicing_parser():
+    np.testing.assert_allclose(orb_math.tle_to_kepler6(*ISS), slice_tle(*ISS), rtol=1e-12, atol=1e-6)
+
+
+def test_blank_field_raises():
+    line2 = ISS[1][:17] + " " * 8 + ISS[1][25:]  # RAAN left blank
+    with pytest.raises(ValueError):
+        orb_math.tle_to_kepler6_batch([ISS[0]], [line2])
+
+
+def test_malformed_field_raises():
+    line2 = ISS[1][:26] + "00x3499" + ISS[1][33:]
+    with pytest.raises(ValueError):
+        orb_math.tle_to_kepler6_batch([ISS[0]], [line2])
+
+
+def test_blank_line_raises():
+    with pytest.raises(ValueError):
+        orb_math.tle_to_kepler6_batch([ISS[0], MOLNIYA[0]], [ISS[1], ""])
+
+
+def test_length_mismatch_raises():
+    with pytest.raises(ValueError):
+        orb_math.tle_to_kepler6_batch([ISS[0], MOLNIYA[0]], [ISS[1]])
+
+
+@pytest.mark.parametrize("as_type", [list, np.array])
+def test_kepler_E_accepts_sequence_e(as_type):
+    M = np.linspace(-3.0, 3.0, 7)
+    e = np.linspace(0.0, 0.9, 7)
+    E = orb_math.kepler_E(M.tolist(), as_type(e.tolist()))
+    np.testing.assert_allclose(E - e*np.sin(E), M, atol=1e-9)
+    # a scalar e still takes the same path as before
+    E_scalar = orb_math.kepler_E(M, 0.3)
+    np.testing.assert_allclose(E_scalar - 0.3*np.sin(E_scalar), M, atol=1e-9)
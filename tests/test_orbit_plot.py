@@ -0,0 +1,33 @@
+import os
+
+import numpy as np
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+QtWidgets = pytest.importorskip("PyQt5.QtWidgets")
+pg = pytest.importorskip("pyqtgraph")
+pytest.importorskip("OpenGL.GL")
+pytest.importorskip("PIL")
+
+from orbit_pyqtgraph import OrbitPlot, tle_to_kepler6
+
+ISS = ("1 25544U 98067A   25229.18034946  .00009619  00000-0  17645-3 0  9996",
+       "2 25544  51.6356   4.7550 0003499 229.5075 130.5609 15.49975761524621")
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+def test_zoomed_ground_track_draws_every_pass(app):
+    plot = OrbitPlot(tle_to_kepler6(*ISS))
+    plot._2d(animation=False, revolves=3)
+    track, = [item for item in plot.pg_plot.listDataItems() if isinstance(item, pg.PlotDataItem)]
+    plot.pg_plot.setXRange(-60, 60, padding=0)
+    lon = track.xData[np.isfinite(track.xData)]
+    in_view = lon[(lon >= -60) & (lon <= 60)]
+    x_drawn, _ = track.getData()
+    # every sample of every pass inside the view is drawn, and the dateline breaks are kept
+    assert np.isin(in_view, x_drawn).all()
+    assert np.isnan(x_drawn).sum() == np.isnan(track.xData).sum()